@@ -0,0 +1,260 @@
+"""
+GraphQL queryset optimizer.
+
+This module inspects the GraphQL selection set of the field being resolved
+and derives the select_related/prefetch_related/only calls needed to serve
+it, so nested relations are fetched with JOINs or a single batched query
+instead of one query per row (N+1).
+
+Usage:
+    def resolve_documents(self, info):
+        queryset = Document.objects.filter(...)
+        return list(optimize_queryset(queryset, info))
+
+Types can override how a GraphQL field maps to the database by defining an
+``optimizations`` dict on the DjangoObjectType class (graphene drops unknown
+Meta options, so it lives on the class itself). Values are a Django field
+path, a tuple of paths, or None for computed fields needing no DB access:
+
+    class DocumentType(DjangoObjectType):
+        optimizations = {'conversation_count': None}
+
+Large columns can be passed as ``defer``; they are skipped unless the query
+selects them, even when a computed field prevents narrowing with only():
+
+    optimize_queryset(queryset, info, defer=('content',))
+
+Computed fields backed by an aggregate can be served from ``annotations``,
+keyed by field name; each is added only when its field is selected:
+
+    optimize_queryset(
+        queryset, info,
+        annotations={'conversation_count': Count('ai_conversations')},
+    )
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from graphene.utils.str_converters import to_snake_case
+from graphene_django.registry import get_global_registry
+from graphql import GraphQLResolveInfo
+from graphql.language import FieldNode, FragmentSpreadNode, InlineFragmentNode, SelectionSetNode
+
+
+class _QueryPlan:
+    """
+    Accumulates the relation paths and columns required by a selection set.
+
+    Attributes:
+        select_related: Forward FK/one-to-one paths to JOIN
+        prefetch_related: Reverse FK/many-to-many paths to batch-load
+        only: Column paths to load, or None when all columns are needed
+        selected: Column paths explicitly selected by the query
+    """
+
+    def __init__(self):
+        """Initialize an empty query plan."""
+        self.select_related: Set[str] = set()
+        self.prefetch_related: Set[str] = set()
+        self.only: Optional[Set[str]] = set()
+        self.selected: Set[str] = set()
+
+    def add_only(self, path: str) -> None:
+        """
+        Add a column path to the only() list, unless all columns are needed.
+
+        Args:
+            path: Django field path (e.g. 'organization__name')
+        """
+        if self.only is not None:
+            self.only.add(path)
+
+
+def optimize_queryset(
+    queryset: QuerySet,
+    info: GraphQLResolveInfo,
+    defer: Iterable[str] = (),
+    annotations: Optional[Dict[str, Any]] = None,
+) -> QuerySet:
+    """
+    Apply select_related/prefetch_related/only based on the GraphQL query.
+
+    Args:
+        queryset: Base queryset returned by the resolver
+        info: GraphQL resolver info object for the field being resolved
+        defer: Column paths to leave unloaded unless the query selects them
+        annotations: Aggregate expressions keyed by GraphQL field name (snake
+            case), annotated as ``_<name>`` only when that field is selected
+
+    Returns:
+        QuerySet: Queryset fetching exactly the requested relations and columns
+    """
+    selection_set = info.field_nodes[0].selection_set
+    if selection_set is None:
+        return queryset
+
+    plan = _QueryPlan()
+    _plan_model(plan, queryset.model, selection_set, info, prefix='', in_select=True)
+
+    if annotations:
+        selected = {
+            to_snake_case(field_node.name.value)
+            for field_node in _iter_field_nodes(selection_set, info)
+        }
+        queryset = queryset.annotate(**{
+            f'_{name}': expression
+            for name, expression in annotations.items()
+            if name in selected
+        })
+
+    if plan.select_related:
+        queryset = queryset.select_related(*sorted(plan.select_related))
+    if plan.prefetch_related:
+        queryset = queryset.prefetch_related(*sorted(plan.prefetch_related))
+    if plan.only is not None:
+        queryset = queryset.only(*sorted(plan.only))
+    else:
+        deferred = [path for path in defer if path not in plan.selected]
+        if deferred:
+            queryset = queryset.defer(*deferred)
+    return queryset
+
+
+def _plan_model(
+    plan: _QueryPlan,
+    model: type[Model],
+    selection_set: SelectionSetNode,
+    info: GraphQLResolveInfo,
+    prefix: str,
+    in_select: bool,
+) -> None:
+    """
+    Add the requirements of one model's selection set to the plan.
+
+    Args:
+        plan: Query plan being built
+        model: Django model the selection set is resolved against
+        selection_set: GraphQL selection set for that model
+        info: GraphQL resolver info object (used to resolve fragments)
+        prefix: Django path prefix of this model relative to the root queryset
+        in_select: Whether this model is reached through select_related only
+            (columns can then be restricted with only())
+    """
+    optimizations = _get_type_optimizations(model)
+
+    if in_select:
+        plan.add_only(prefix + model._meta.pk.attname)
+        # FK columns are cheap and needed by permission checks and JOINs
+        for field in model._meta.concrete_fields:
+            if field.is_relation:
+                plan.add_only(prefix + field.name)
+
+    for field_node in _iter_field_nodes(selection_set, info):
+        name = to_snake_case(field_node.name.value)
+        if name == '__typename':
+            continue
+
+        if name in optimizations:
+            paths = optimizations[name]
+            if paths is None:
+                continue
+            if isinstance(paths, str):
+                paths = (paths,)
+            for path in paths:
+                _plan_path(plan, model, path, None, info, prefix, in_select)
+            continue
+
+        _plan_path(plan, model, name, field_node.selection_set, info, prefix, in_select)
+
+
+def _plan_path(
+    plan: _QueryPlan,
+    model: type[Model],
+    path: str,
+    selection_set: Optional[SelectionSetNode],
+    info: GraphQLResolveInfo,
+    prefix: str,
+    in_select: bool,
+) -> None:
+    """
+    Add a single model field (or field path) to the plan.
+
+    Args:
+        plan: Query plan being built
+        model: Django model the path starts from
+        path: Django field name or '__'-separated path
+        selection_set: Nested GraphQL selection set, if any
+        info: GraphQL resolver info object
+        prefix: Django path prefix of the model relative to the root queryset
+        in_select: Whether the model is reached through select_related only
+    """
+    name, _, rest = path.partition('__')
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        # Computed field: we cannot know which columns it reads
+        if in_select:
+            plan.only = None
+        return
+
+    full_path = prefix + name
+
+    if not field.is_relation:
+        plan.selected.add(full_path)
+        if in_select:
+            plan.add_only(full_path)
+        return
+
+    related_model = field.related_model
+    if (field.many_to_one or field.one_to_one) and field.concrete and in_select:
+        plan.select_related.add(full_path)
+        nested_in_select = True
+    else:
+        plan.prefetch_related.add(full_path)
+        nested_in_select = False
+
+    if rest:
+        _plan_path(plan, related_model, rest, None, info, full_path + '__', nested_in_select)
+    elif selection_set is not None:
+        _plan_model(plan, related_model, selection_set, info, full_path + '__', nested_in_select)
+    elif nested_in_select:
+        plan.only = None
+
+
+def _iter_field_nodes(selection_set: SelectionSetNode, info: GraphQLResolveInfo) -> List[FieldNode]:
+    """
+    Flatten a selection set into field nodes, expanding fragments.
+
+    Args:
+        selection_set: GraphQL selection set
+        info: GraphQL resolver info object holding named fragments
+
+    Returns:
+        list[FieldNode]: Field nodes selected, including those from fragments
+    """
+    fields: List[FieldNode] = []
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            fields.append(selection)
+        elif isinstance(selection, InlineFragmentNode):
+            fields.extend(_iter_field_nodes(selection.selection_set, info))
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = info.fragments.get(selection.name.value)
+            if fragment is not None:
+                fields.extend(_iter_field_nodes(fragment.selection_set, info))
+    return fields
+
+
+def _get_type_optimizations(model: type[Model]) -> Dict[str, object]:
+    """
+    Get the optimizations declared on the GraphQL type registered for a model.
+
+    Args:
+        model: Django model class
+
+    Returns:
+        dict: Mapping of GraphQL field name to Django path(s) or None
+    """
+    graphene_type = get_global_registry().get_type_for_model(model)
+    return getattr(graphene_type, 'optimizations', None) or {}
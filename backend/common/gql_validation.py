@@ -0,0 +1,182 @@
+"""
+GraphQL query cost validation.
+
+This module provides a validation rule that estimates the cost of every
+operation before it runs and rejects operations above a budget, so a single
+request (for example many aliased copies of an expensive field, or lists
+nested inside lists) cannot starve the workers. Depth is limited separately
+with graphene's ``depth_limit_validator``.
+
+Cost model:
+- every field costs 1 unless its resolver is annotated with ``@cost``
+- the selections below a list field are multiplied by LIST_COST_MULTIPLIER,
+  since lists in this schema are not paginated
+
+Usage:
+    class Query(graphene.ObjectType):
+        @cost(complexity=10)
+        def resolve_documents(self, info):
+            ...
+
+    class AskQuestion(graphene.Mutation):
+        @classmethod
+        @cost(complexity=50)
+        def mutate(cls, root, info, ...):
+            ...
+
+    validation_rules = (*specified_rules, cost_limit_validator(max_cost=1000))
+"""
+from typing import Callable, Optional, Set
+
+from graphene.utils.str_converters import to_snake_case
+from graphql import (
+    GraphQLError,
+    GraphQLField,
+    GraphQLObjectType,
+    get_named_type,
+    get_nullable_type,
+    is_list_type,
+)
+from graphql.language import (
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    OperationType,
+    SelectionSetNode,
+)
+from graphql.validation import ValidationRule
+
+
+# Assumed number of items returned by a list field
+LIST_COST_MULTIPLIER = 10
+
+# Cost of a field whose resolver has no @cost annotation
+DEFAULT_FIELD_COST = 1
+
+
+def cost(complexity: int) -> Callable:
+    """
+    Annotate a resolver (or a mutation's mutate) with its query cost.
+
+    Args:
+        complexity: Cost charged each time the field is selected
+
+    Returns:
+        Callable: Decorator returning the resolver unchanged
+    """
+    def decorator(func: Callable) -> Callable:
+        func._graphql_cost = complexity
+        return func
+    return decorator
+
+
+def get_field_cost(parent_type: GraphQLObjectType, field_name: str, field: GraphQLField) -> int:
+    """
+    Look up the cost of a field from its graphene resolver annotation.
+
+    Args:
+        parent_type: GraphQL type the field belongs to
+        field_name: Name of the field as selected in the query
+        field: Field definition
+
+    Returns:
+        int: Cost of selecting the field once
+    """
+    graphene_type = getattr(parent_type, 'graphene_type', None)
+    resolver = getattr(graphene_type, f'resolve_{to_snake_case(field_name)}', None)
+    if resolver is None:
+        # Mutation fields resolve through the payload type's mutate()
+        payload_type = getattr(get_named_type(field.type), 'graphene_type', None)
+        resolver = getattr(payload_type, 'mutate', None)
+    return getattr(resolver, '_graphql_cost', DEFAULT_FIELD_COST)
+
+
+def cost_limit_validator(max_cost: int):
+    """
+    Build a validation rule rejecting operations costlier than max_cost.
+
+    Args:
+        max_cost: Highest allowed cost per operation
+
+    Returns:
+        type: ValidationRule subclass to pass to graphql.validate
+    """
+    class CostLimitValidator(ValidationRule):
+        """Reject operations whose estimated cost exceeds the budget."""
+
+        def enter_operation_definition(self, node: OperationDefinitionNode, *_args):
+            schema = self.context.schema
+            root_type = {
+                OperationType.QUERY: schema.query_type,
+                OperationType.MUTATION: schema.mutation_type,
+                OperationType.SUBSCRIPTION: schema.subscription_type,
+            }.get(node.operation)
+            if root_type is None:
+                return
+
+            total = self._selection_set_cost(node.selection_set, root_type, set())
+            if total > max_cost:
+                name = node.name.value if node.name else 'anonymous'
+                self.report_error(
+                    GraphQLError(
+                        f"'{name}' exceeds maximum operation cost of {max_cost} (cost {total}).",
+                        [node],
+                        extensions={'code': 'QUERY_TOO_COMPLEX'}
+                    )
+                )
+
+        def _selection_set_cost(
+            self,
+            selection_set: Optional[SelectionSetNode],
+            parent_type,
+            visited_fragments: Set[str],
+        ) -> int:
+            if selection_set is None or not isinstance(parent_type, GraphQLObjectType):
+                return 0
+
+            total = 0
+            for selection in selection_set.selections:
+                if isinstance(selection, FieldNode):
+                    field_name = selection.name.value
+                    field = parent_type.fields.get(field_name)
+                    if field is None:
+                        # Introspection fields and unknown fields (reported by
+                        # FieldsOnCorrectTypeRule) are free
+                        continue
+                    children = self._selection_set_cost(
+                        selection.selection_set,
+                        get_named_type(field.type),
+                        visited_fragments,
+                    )
+                    if is_list_type(get_nullable_type(field.type)):
+                        children *= LIST_COST_MULTIPLIER
+                    total += get_field_cost(parent_type, field_name, field) + children
+
+                elif isinstance(selection, InlineFragmentNode):
+                    fragment_type = parent_type
+                    if selection.type_condition is not None:
+                        fragment_type = self.context.schema.get_type(
+                            selection.type_condition.name.value
+                        )
+                    total += self._selection_set_cost(
+                        selection.selection_set, fragment_type, visited_fragments
+                    )
+
+                elif isinstance(selection, FragmentSpreadNode):
+                    fragment_name = selection.name.value
+                    fragment = self.context.get_fragment(fragment_name)
+                    # Cycles are reported by NoFragmentCyclesRule
+                    if fragment is None or fragment_name in visited_fragments:
+                        continue
+                    fragment_type = self.context.schema.get_type(
+                        fragment.type_condition.name.value
+                    )
+                    total += self._selection_set_cost(
+                        fragment.selection_set,
+                        fragment_type,
+                        visited_fragments | {fragment_name},
+                    )
+            return total
+
+    return CostLimitValidator
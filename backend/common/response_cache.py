@@ -0,0 +1,31 @@
+"""
+Versioned GraphQL response cache.
+
+Cached query responses (see config/views.py) are stored under the current
+cache version. Any write that can change a query result bumps the version,
+which makes every older entry unreachable at once; stale entries then
+expire on their own TTL.
+"""
+from django.core.cache import cache
+
+
+# Cache key holding the current response cache version
+RESPONSE_CACHE_VERSION_KEY = 'gql:version'
+
+
+def get_response_cache_version() -> int:
+    """
+    Get the current GraphQL response cache version.
+
+    Returns:
+        int: Version number, bumped on every relevant write
+    """
+    return cache.get(RESPONSE_CACHE_VERSION_KEY, 0)
+
+
+def invalidate_response_cache() -> None:
+    """Invalidate every cached GraphQL response."""
+    try:
+        cache.incr(RESPONSE_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(RESPONSE_CACHE_VERSION_KEY, 1, None)
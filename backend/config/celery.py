@@ -0,0 +1,19 @@
+"""
+Celery configuration for Document AI Assistant project.
+
+Celery runs slow work (LLM calls) outside the web request. Settings are
+read from Django settings with the CELERY_ prefix, and tasks are
+discovered from each app's tasks.py module.
+
+Start a worker with:
+    celery -A config worker -l info
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+app = Celery('documentai')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
@@ -8,43 +8,63 @@ This module aggregates and combines all GraphQL schemas from different apps:
 
 The schema follows the GraphQL schema design pattern where queries are read-only
 operations and mutations are write operations.
+
+The schema is built lazily: app schemas (and the graphene type machinery they
+pull in) are only imported the first time the schema is used, which keeps
+worker boot, management commands and admin-only processes fast. get_schema()
+is the single place a graphene.Schema is constructed, and it is cached, so the
+type map is built at most once per process.
 """
-import graphene
-from users.schema import Mutation as UserMutation
-from organizations.schema import Query as OrganizationQuery, Mutation as OrganizationMutation
-from documents.schema import Query as DocumentQuery, Mutation as DocumentMutation
+import functools
+
+from django.utils.functional import SimpleLazyObject
 
 
-class Query(
-    OrganizationQuery,
-    DocumentQuery,
-    graphene.ObjectType
-):
+@functools.cache
+def get_schema():
     """
-    Root Query type for the GraphQL API.
+    Import every app schema and assemble the root GraphQL schema.
     
-    All read operations (queries) are aggregated here from various apps.
-    Includes organization and document queries.
+    The result is cached; every caller shares the same schema instance.
+    
+    Returns:
+        graphene.Schema: Schema with the root Query and Mutation types
     """
-    pass
+    import graphene
+    from users.schema import Mutation as UserMutation
+    from organizations.schema import Query as OrganizationQuery, Mutation as OrganizationMutation
+    from documents.schema import Query as DocumentQuery, Mutation as DocumentMutation
 
+    class Query(
+        OrganizationQuery,
+        DocumentQuery,
+        graphene.ObjectType
+    ):
+        """
+        Root Query type for the GraphQL API.
+        
+        All read operations (queries) are aggregated here from various apps.
+        Includes organization and document queries.
+        """
+        pass
 
-class Mutation(
-    UserMutation,
-    OrganizationMutation,
-    DocumentMutation,
-    graphene.ObjectType
-):
-    """
-    Root Mutation type for the GraphQL API.
-    
-    All write operations (mutations) are aggregated here from various apps.
-    Includes authentication, organization, and document mutations.
-    """
-    pass
+    class Mutation(
+        UserMutation,
+        OrganizationMutation,
+        DocumentMutation,
+        graphene.ObjectType
+    ):
+        """
+        Root Mutation type for the GraphQL API.
+        
+        All write operations (mutations) are aggregated here from various apps.
+        Includes authentication, organization, and document mutations.
+        """
+        pass
 
+    return graphene.Schema(query=Query, mutation=Mutation)
 
-# Create the GraphQL schema instance
-# This is the entry point for all GraphQL operations
-schema = graphene.Schema(query=Query, mutation=Mutation)
 
+# Create the GraphQL schema instance
+# This is the entry point for all GraphQL operations; it is built on first access
+schema = SimpleLazyObject(get_schema)
@@ -4,29 +4,47 @@ Django settings for Document AI Assistant project.
 This module contains all Django configuration settings, including:
 - Application configuration
 - Database settings
+- Cache settings
 - Authentication & Authorization
 - GraphQL & JWT configuration
 - CORS settings
 - LLM integration settings
+- Celery task queue settings
 
-Environment variables are loaded from .env file in the project root.
+Environment variables are loaded from .env file in the project root when
+one exists (development); deployments set real environment variables and
+skip importing python-dotenv entirely.
 """
 import os
 from pathlib import Path
 from typing import List
-from dotenv import load_dotenv
 
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent
 PROJECT_ROOT = BASE_DIR.parent
 
-# Load environment variables from .env file
-load_dotenv(dotenv_path=PROJECT_ROOT / '.env')
+# Load environment variables from .env file, if present
+ENV_FILE = PROJECT_ROOT / '.env'
+if ENV_FILE.is_file():
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=ENV_FILE)
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Read a 'true'/'false' environment variable."""
+    value = os.environ.get(name)
+    return default if value is None else value.strip().lower() == 'true'
+
+
+def env_list(name: str, default: str) -> List[str]:
+    """Read a comma-separated environment variable, dropping blanks."""
+    return [item.strip() for item in os.environ.get(name, default).split(',') if item.strip()]
+
 
 # Security Settings
 SECRET_KEY = os.getenv('SECRET_KEY', 'django-insecure-change-me-in-production')
-DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
-ALLOWED_HOSTS: List[str] = os.getenv('ALLOWED_HOSTS', '*').split(',')
+DEBUG = env_bool('DEBUG', True)
+ALLOWED_HOSTS: List[str] = env_list('ALLOWED_HOSTS', '*')
 
 # Application definition
 # Organized by: Django core apps, third-party apps, local apps
@@ -38,6 +56,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third-party applications
     'corsheaders',
@@ -79,6 +98,8 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'config.wsgi.application'
+# Preferred entry point: uvicorn config.asgi:application (needed for streaming)
+ASGI_APPLICATION = 'config.asgi.application'
 
 # Database Configuration
 # Uses PostgreSQL as the primary database for multi-tenant document management
@@ -90,10 +111,37 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', 'postgres'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
-        'CONN_MAX_AGE': 600,  # Persistent connections for better performance
+        # Pooling is left to PgBouncer (transaction mode): point DB_HOST/DB_PORT
+        # at it (e.g. pgbouncer:6432) instead of holding an idle Postgres
+        # backend per worker. Connections are closed after each request.
+        # For the same reason queries are not PREPAREd by name: a prepared
+        # statement lives in one server session, which transaction pooling
+        # does not pin, and a per-request connection would re-prepare it
+        # every time anyway.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '0')),
+        # Server-side cursors do not survive transaction pooling
+        'DISABLE_SERVER_SIDE_CURSORS': env_bool('DB_DISABLE_SERVER_SIDE_CURSORS', True),
     }
 }
 
+# Cache Configuration
+# Local memory cache for a single process; set CACHE_URL to a Redis URL so
+# every worker shares cached data (e.g. JWT-authenticated users)
+CACHE_URL = os.getenv('CACHE_URL')
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Custom User Model
 AUTH_USER_MODEL = 'users.User'
 
@@ -127,13 +175,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # CORS Configuration
 # Configure allowed origins for cross-origin requests from React frontend
-CORS_ALLOWED_ORIGINS = [
-    origin.strip() 
-    for origin in os.getenv(
-        'ALLOWED_ORIGINS', 
-        'http://localhost:3000,http://localhost:3001'
-    ).split(',')
-]
+CORS_ALLOWED_ORIGINS = env_list('ALLOWED_ORIGINS', 'http://localhost:3000,http://localhost:3001')
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_HEADERS = [
     'accept',
@@ -153,8 +195,14 @@ GRAPHENE = {
     'SCHEMA': 'config.schema.schema',
     'MIDDLEWARE': [
         'graphql_jwt.middleware.JSONWebTokenMiddleware',
+        # Listed after the JWT middleware so it runs first (see users/middleware.py)
+        'users.middleware.CachedJWTAuthMiddleware',
+        'documents.middleware.DocumentContextLoaderMiddleware',
+        'users.middleware.UserLoaderMiddleware',
     ],
-    'ATOMIC_MUTATIONS': True,  # Wrap mutations in transactions
+    # Mutations are not wrapped in a transaction as a whole: that would hold a
+    # connection open across slow LLM calls. Each mutation opens a narrow
+    # transaction.atomic() around its multi-statement writes instead.
 }
 
 # Authentication Backends
@@ -170,12 +218,26 @@ JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', SECRET_KEY)
 JWT_ALGORITHM = os.getenv('JWT_ALGORITHM', 'HS256')
 JWT_EXPIRATION_DELTA = None  # Use default from django-graphql-jwt
 
+GRAPHQL_JWT = {
+    # Reuse verified payloads of repeatedly sent tokens (see users/jwt_decode.py)
+    'JWT_DECODE_HANDLER': 'users.jwt_decode.cached_jwt_decode',
+    # Same tokens as the defaults, built with less per-token work (see users/jwt_encode.py)
+    'JWT_PAYLOAD_HANDLER': 'users.jwt_encode.fast_jwt_payload',
+    'JWT_ENCODE_HANDLER': 'users.jwt_encode.fast_jwt_encode',
+}
+
 # LLM Integration Settings
 # Configuration for Large Language Model API integration
 LLM_API_KEY = os.getenv('LLM_API_KEY')
 LLM_PROVIDER = os.getenv('LLM_PROVIDER', 'openai').lower()
 LLM_MODEL = os.getenv('LLM_MODEL', 'gpt-4-turbo-preview')
 
+# Celery Configuration
+# Background task queue for LLM calls (see documents/tasks.py)
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_TASK_ALWAYS_EAGER = env_bool('CELERY_TASK_ALWAYS_EAGER', False)
+CELERY_TASK_IGNORE_RESULT = True  # Results are stored on AIConversation rows
+
 # Validate LLM configuration
 if not LLM_API_KEY and DEBUG:
     import warnings
@@ -3,18 +3,21 @@ URL configuration for Document AI Assistant project.
 
 This module defines the URL routing for the application:
 - /admin/: Django admin interface
-- /graphql/: GraphQL API endpoint with GraphiQL IDE
+- /graphql/: GraphQL API endpoint (GraphiQL IDE in DEBUG only)
+- /graphql/stream/ask/: Streaming AI answers (ASGI only)
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path
-from graphene_django.views import GraphQLView
 from django.views.decorators.csrf import csrf_exempt
+from config.views import DocumentAIGraphQLView
+from documents.views import ask_document_ai_question_stream
 
 # URL patterns
 # Note: GraphQL endpoint uses csrf_exempt because JWT tokens handle authentication
-# GraphiQL is enabled for development - should be disabled in production
+# GraphiQL (and schema introspection, see config/views.py) is only enabled with DEBUG
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('graphql/', csrf_exempt(GraphQLView.as_view(graphiql=True))),
+    path('graphql/', csrf_exempt(DocumentAIGraphQLView.as_view(graphiql=settings.DEBUG))),
+    path('graphql/stream/ask/', ask_document_ai_question_stream),
 ]
-
@@ -0,0 +1,444 @@
+"""
+GraphQL view for Document AI Assistant project.
+
+This module provides the GraphQL view used by the /graphql/ endpoint.
+It extends graphene-django's GraphQLView with caching of work that only
+depends on the (static) schema, so it is not repeated on every request:
+- parsed and validated query documents, keyed by SHA-256 of the query text
+- automatic persisted queries (clients may send only the query hash)
+- introspection results
+- full JSON responses of read-only queries, per token, for a short TTL
+
+Execution is synchronous. graphene-django 3.2 has no async view, and the
+JWT middlewares and resolvers use the sync ORM; under ASGI Django runs the
+view in a worker thread per request, so requests still overlap. Latency
+that benefits from asyncio (streaming LLM answers, MCP context read with
+the async ORM) is served by the async view in documents/views.py.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.http import HttpResponseNotAllowed
+from django.http.response import HttpResponseBadRequest
+from graphene.validation import depth_limit_validator
+from graphene_django.constants import MUTATION_ERRORS_FLAG
+from graphene_django.settings import graphene_settings
+from graphene_django.views import GraphQLView, HttpError
+from graphql import (
+    ExecutionResult,
+    GraphQLError,
+    NoSchemaIntrospectionCustomRule,
+    OperationType,
+    execute,
+    get_operation_ast,
+    parse,
+    specified_rules,
+    validate,
+    validate_schema,
+)
+from graphql.language import DocumentNode, FieldNode
+from graphql_jwt.utils import get_http_authorization
+
+from common.gql_validation import cost_limit_validator
+from common.response_cache import get_response_cache_version
+
+
+# Root fields that only read the schema, never application data
+INTROSPECTION_FIELDS = frozenset({'__schema', '__type', '__typename'})
+
+# Upper bound on distinct introspection documents kept in memory
+INTROSPECTION_CACHE_SIZE = 64
+
+# Upper bound on distinct parsed/validated query documents kept in memory
+DOCUMENT_CACHE_SIZE = 512
+
+# Deepest allowed selection nesting per operation
+MAX_QUERY_DEPTH = 7
+
+# Highest allowed estimated cost per operation (see common/gql_validation.py)
+MAX_QUERY_COST = 1000
+
+# Seconds a query response is served from cache (writes invalidate sooner)
+RESPONSE_CACHE_TIMEOUT = 30
+
+
+class DocumentAIGraphQLView(GraphQLView):
+    """
+    GraphQL view with schema-level caching.
+
+    The React client sends the same handful of operations over and over,
+    and both parsing and validation are pure functions of the query text
+    and the schema. Each distinct query is parsed and validated once per
+    process and the resulting AST is executed directly afterwards.
+
+    The same cache backs automatic persisted queries (APQ): a client may
+    send only ``extensions.persistedQuery.sha256Hash`` once the full query
+    has been seen, and retries with the full text on PersistedQueryNotFound.
+
+    Introspection results are cached as well, since they only depend on the
+    schema and skip execution entirely. Outside DEBUG introspection is
+    rejected during validation, as are operations nested deeper than
+    MAX_QUERY_DEPTH or estimated above MAX_QUERY_COST, before any resolver
+    runs.
+
+    Finally, successful query (never mutation) responses are stored in
+    Django's cache for RESPONSE_CACHE_TIMEOUT seconds, keyed by query,
+    variables and the caller's token, so repeated list queries are served
+    without touching the database. Keys are versioned; writes to documents,
+    conversations, organizations, memberships and users bump the version
+    (see common/response_cache.py).
+    """
+
+    # Standard rules plus depth/cost limits, and a ban on __schema/__type
+    # queries outside DEBUG. Custom rules replace graphql-core's defaults, so
+    # specified_rules is kept.
+    validation_rules = (
+        *specified_rules,
+        depth_limit_validator(max_depth=MAX_QUERY_DEPTH),
+        cost_limit_validator(max_cost=MAX_QUERY_COST),
+        *(() if settings.DEBUG else (NoSchemaIntrospectionCustomRule,)),
+    )
+
+    _document_cache: 'OrderedDict[str, Tuple[DocumentNode, List[GraphQLError]]]' = OrderedDict()
+    _document_lock = threading.Lock()
+
+    _introspection_cache: Dict[Tuple[str, Optional[str], str], ExecutionResult] = {}
+    _introspection_lock = threading.Lock()
+
+    def get_response(self, request, data, show_graphiql=False):
+        """
+        Build the JSON response, serving cached query responses when possible.
+
+        Args:
+            request: HTTP request object
+            data: Parsed request body
+            show_graphiql: Whether GraphiQL is being rendered
+
+        Returns:
+            tuple: (response JSON string, HTTP status code)
+        """
+        cache_key = None
+        if not show_graphiql and not self.batch:
+            cache_key = self._get_response_cache_key(request, data)
+
+        if cache_key is not None:
+            # Read the version before executing, so a write that lands while
+            # this request runs leaves the response under the old version
+            version = get_response_cache_version()
+            cached = cache.get(cache_key, version=version)
+            if cached is not None:
+                return cached, 200
+
+        result, status_code = super().get_response(request, data, show_graphiql)
+
+        if (
+            cache_key is not None
+            and status_code == 200
+            and getattr(request, '_graphql_response_cacheable', False)
+        ):
+            cache.set(cache_key, result, RESPONSE_CACHE_TIMEOUT, version=version)
+        return result, status_code
+
+    def _get_response_cache_key(self, request, data) -> Optional[str]:
+        """
+        Build a response cache key for an authenticated read-only query.
+
+        Args:
+            request: HTTP request object
+            data: Parsed request body
+
+        Returns:
+            str: Cache key, or None if the response must not be cached
+        """
+        token = get_http_authorization(request)
+        if not token:
+            return None
+
+        try:
+            query, variables, operation_name, _ = self.get_graphql_params(request, data)
+            query_hash = self._get_persisted_query_hash(request, data)
+            if not query and not query_hash:
+                return None
+            document, validation_errors = self._get_document(
+                self.schema.graphql_schema, query, query_hash
+            )
+        except (GraphQLError, HttpError):
+            return None
+
+        if validation_errors:
+            return None
+
+        operation_ast = get_operation_ast(document, operation_name)
+        if operation_ast is None or operation_ast.operation != OperationType.QUERY:
+            return None
+
+        key = hashlib.blake2b(
+            '|'.join((
+                query_hash or hashlib.sha256(query.encode('utf-8')).hexdigest(),
+                json.dumps(variables or {}, sort_keys=True),
+                operation_name or '',
+                token,
+            )).encode('utf-8')
+        ).hexdigest()
+        return f'gql:response:{key}'
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        """
+        Execute a GraphQL request using cached documents where possible.
+
+        Args:
+            request: HTTP request object
+            data: Parsed request body
+            query: GraphQL query string
+            variables: Query variables
+            operation_name: Name of the operation to execute
+            show_graphiql: Whether GraphiQL is being rendered
+
+        Returns:
+            ExecutionResult: Result of the GraphQL execution
+        """
+        try:
+            query_hash = self._get_persisted_query_hash(request, data)
+        except GraphQLError as e:
+            return ExecutionResult(data=None, errors=[e])
+
+        if not query and not query_hash:
+            if show_graphiql:
+                return None
+            raise HttpError(HttpResponseBadRequest('Must provide query string.'))
+
+        schema = self.schema.graphql_schema
+
+        schema_validation_errors = validate_schema(schema)
+        if schema_validation_errors:
+            return ExecutionResult(data=None, errors=schema_validation_errors)
+
+        try:
+            document, validation_errors = self._get_document(schema, query, query_hash)
+        except GraphQLError as e:
+            return ExecutionResult(data=None, errors=[e])
+
+        operation_ast = get_operation_ast(document, operation_name)
+
+        if (
+            request.method.lower() == 'get'
+            and operation_ast is not None
+            and operation_ast.operation != OperationType.QUERY
+        ):
+            if show_graphiql:
+                return None
+
+            raise HttpError(
+                HttpResponseNotAllowed(
+                    ['POST'],
+                    'Can only perform a {} operation from a POST request.'.format(
+                        operation_ast.operation.value
+                    ),
+                )
+            )
+
+        if validation_errors:
+            return ExecutionResult(data=None, errors=validation_errors)
+
+        introspection_key = self._get_introspection_cache_key(
+            query, operation_ast, variables, operation_name
+        )
+        if introspection_key is not None:
+            cached = self._introspection_cache.get(introspection_key)
+            if cached is not None:
+                return cached
+
+        result = self._execute_document(
+            request, schema, document, operation_ast, variables, operation_name
+        )
+        request._graphql_response_cacheable = not result.errors
+
+        if introspection_key is not None and not result.errors:
+            with self._introspection_lock:
+                if len(self._introspection_cache) < INTROSPECTION_CACHE_SIZE:
+                    self._introspection_cache[introspection_key] = result
+        return result
+
+    def _execute_document(
+        self, request, schema, document, operation_ast, variables, operation_name
+    ) -> ExecutionResult:
+        """
+        Execute an already parsed and validated document.
+
+        Args:
+            request: HTTP request object
+            schema: GraphQL schema to execute against
+            document: Parsed query document
+            operation_ast: Operation selected from the document
+            variables: Query variables
+            operation_name: Name of the operation to execute
+
+        Returns:
+            ExecutionResult: Result of the GraphQL execution
+        """
+        try:
+            execute_options = {
+                'root_value': self.get_root_value(request),
+                'context_value': self.get_context(request),
+                'variable_values': variables,
+                'operation_name': operation_name,
+                'middleware': self.get_middleware(request),
+            }
+            if self.execution_context_class:
+                execute_options['execution_context_class'] = self.execution_context_class
+
+            if (
+                operation_ast is not None
+                and operation_ast.operation == OperationType.MUTATION
+                and (
+                    graphene_settings.ATOMIC_MUTATIONS is True
+                    or connection.settings_dict.get('ATOMIC_MUTATIONS', False) is True
+                )
+            ):
+                with transaction.atomic():
+                    result = execute(schema, document, **execute_options)
+                    if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                        transaction.set_rollback(True)
+                return result
+
+            return execute(schema, document, **execute_options)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
+
+    def _get_document(
+        self, schema, query: Optional[str], query_hash: Optional[str]
+    ) -> Tuple[DocumentNode, List[GraphQLError]]:
+        """
+        Return the parsed document and its validation errors, using the cache.
+
+        Args:
+            schema: GraphQL schema to validate against
+            query: GraphQL query string (may be omitted for persisted queries)
+            query_hash: SHA-256 hex digest sent by an APQ client, if any
+
+        Returns:
+            tuple: (document, validation_errors)
+
+        Raises:
+            GraphQLError: If the query cannot be parsed, the persisted query is
+                unknown, or the hash does not match the query text
+        """
+        if query:
+            key = hashlib.sha256(query.encode('utf-8')).hexdigest()
+            if query_hash and query_hash != key:
+                raise GraphQLError(
+                    'provided sha does not match query',
+                    extensions={'code': 'BAD_REQUEST'}
+                )
+        else:
+            key = query_hash
+
+        with self._document_lock:
+            cached = self._document_cache.get(key)
+            if cached is not None:
+                self._document_cache.move_to_end(key)
+                return cached
+
+        if not query:
+            raise GraphQLError(
+                'PersistedQueryNotFound',
+                extensions={'code': 'PERSISTED_QUERY_NOT_FOUND'}
+            )
+
+        try:
+            document = parse(query)
+        except GraphQLError:
+            raise
+        except Exception as e:
+            raise GraphQLError(str(e), original_error=e)
+
+        validation_errors = validate(
+            schema,
+            document,
+            self.validation_rules,
+            graphene_settings.MAX_VALIDATION_ERRORS,
+        )
+
+        entry = (document, validation_errors)
+        with self._document_lock:
+            self._document_cache[key] = entry
+            self._document_cache.move_to_end(key)
+            while len(self._document_cache) > DOCUMENT_CACHE_SIZE:
+                self._document_cache.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _get_persisted_query_hash(request, data) -> Optional[str]:
+        """
+        Read the APQ hash from the request extensions, if present.
+
+        Args:
+            request: HTTP request object
+            data: Parsed request body
+
+        Returns:
+            str: SHA-256 hex digest of the query, or None
+
+        Raises:
+            GraphQLError: If the extensions are not valid JSON
+        """
+        extensions = data.get('extensions') or request.GET.get('extensions')
+        if not extensions:
+            return None
+
+        if isinstance(extensions, str):
+            try:
+                extensions = json.loads(extensions)
+            except ValueError:
+                raise GraphQLError(
+                    'Extensions are invalid JSON.',
+                    extensions={'code': 'BAD_REQUEST'}
+                )
+
+        persisted_query = extensions.get('persistedQuery') if isinstance(extensions, dict) else None
+        if not isinstance(persisted_query, dict):
+            return None
+
+        query_hash = persisted_query.get('sha256Hash')
+        return query_hash.lower() if isinstance(query_hash, str) else None
+
+    @staticmethod
+    def _get_introspection_cache_key(
+        query: Optional[str],
+        operation_ast,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> Optional[Tuple[str, Optional[str], str]]:
+        """
+        Build a cache key if the operation only selects introspection fields.
+
+        Args:
+            query: GraphQL query string
+            operation_ast: Operation selected from the parsed document
+            variables: Query variables
+            operation_name: Name of the operation to execute
+
+        Returns:
+            tuple: Cache key, or None if the operation is not cacheable
+        """
+        if not query or '__schema' not in query and '__type' not in query:
+            return None
+
+        if operation_ast is None or operation_ast.operation != OperationType.QUERY:
+            return None
+
+        for selection in operation_ast.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                return None
+            if selection.name.value not in INTROSPECTION_FIELDS:
+                return None
+
+        return (query, operation_name, json.dumps(variables or {}, sort_keys=True))
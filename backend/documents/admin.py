@@ -5,9 +5,23 @@ This module registers Document and AIConversation models with Django admin
 and customizes the admin interface for document and conversation management.
 """
 from django.contrib import admin
-from django.utils.html import format_html
+from django.db.models import Count, Q
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
+from common.admin_utils import is_changelist
 from .models import Document, AIConversation
+from .search import full_text_search_filter, is_full_text_search_available
+
+
+# Static HTML for list/preview columns, built once instead of per row.
+# Only the dynamic part is escaped at render time.
+_COUNT_TEMPLATES = {
+    True: '<span style="color: green; font-weight: bold;">{}</span>',
+    False: '<span style="color: gray; font-weight: bold;">{}</span>',
+}
+_PREVIEW_TPL = '<div style="max-width: 600px; white-space: pre-wrap;">{}</div>'
+_QUESTION_PREVIEW_TPL = '<div style="max-width: 600px; font-weight: bold; color: #0066cc;">{}</div>'
 
 
 @admin.register(Document)
@@ -65,15 +79,10 @@ class DocumentAdmin(admin.ModelAdmin):
         Returns:
             str: Formatted conversation count
         """
-        count = obj.conversation_count
-        color = 'green' if count > 0 else 'gray'
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{}</span>',
-            color,
-            count
-        )
+        count = getattr(obj, '_conversation_count', 0)
+        return mark_safe(_COUNT_TEMPLATES[count > 0].format(int(count)))
     conversation_count_display.short_description = _('AI Conversations')
-    conversation_count_display.admin_order_field = 'ai_conversations__count'
+    conversation_count_display.admin_order_field = '_conversation_count'
     
     def content_preview(self, obj: Document) -> str:
         """
@@ -85,25 +94,56 @@ class DocumentAdmin(admin.ModelAdmin):
         Returns:
             str: Formatted content preview
         """
-        preview = obj.content_preview(max_length=200)
-        return format_html(
-            '<div style="max-width: 600px; white-space: pre-wrap;">{}</div>',
-            preview
-        )
+        preview = obj.content_preview_cached
+        return mark_safe(_PREVIEW_TPL.format(escape(preview)))
     content_preview.short_description = _('Content Preview')
     
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search title and content through the full-text index.
+        
+        On PostgreSQL the GIN-indexed search_vector replaces ILIKE scans over
+        the content column; other databases use the default search_fields.
+        
+        Args:
+            request: HTTP request object
+            queryset: Queryset to filter
+            search_term: Raw search input
+        
+        Returns:
+            tuple: (filtered queryset, whether duplicates are possible)
+        """
+        if not search_term or not is_full_text_search_available():
+            return super().get_search_results(request, queryset, search_term)
+        
+        return queryset.filter(
+            full_text_search_filter(search_term)
+            | Q(organization__name__icontains=search_term)
+        ), False
+    
     def get_queryset(self, request):
         """
         Optimize queryset by selecting related objects.
         
+        The conversation count is annotated in SQL so the changelist runs one
+        aggregate query instead of loading every conversation row. The
+        changelist never shows the content, so it is not loaded there.
+        
         Args:
             request: HTTP request object
-            
+        
         Returns:
             QuerySet: Optimized queryset
         """
         queryset = super().get_queryset(request)
-        return queryset.select_related('organization', 'created_by').prefetch_related('ai_conversations')
+        queryset = queryset.select_related('organization', 'created_by').annotate(
+            _conversation_count=Count('ai_conversations')
+        )
+        if is_changelist(request, self.model):
+            queryset = queryset.only(
+                'title', 'organization', 'created_by', 'created_at', 'updated_at'
+            )
+        return queryset
 
 
 @admin.register(AIConversation)
@@ -156,11 +196,8 @@ class AIConversationAdmin(admin.ModelAdmin):
         Returns:
             str: Formatted question preview
         """
-        preview = obj.question_preview(max_length=150)
-        return format_html(
-            '<div style="max-width: 600px; font-weight: bold; color: #0066cc;">{}</div>',
-            preview
-        )
+        preview = obj.question_preview_cached
+        return mark_safe(_QUESTION_PREVIEW_TPL.format(escape(preview)))
     question_preview_display.short_description = _('Question Preview')
     
     def answer_preview_display(self, obj: AIConversation) -> str:
@@ -173,17 +210,43 @@ class AIConversationAdmin(admin.ModelAdmin):
         Returns:
             str: Formatted answer preview
         """
-        preview = obj.answer_preview(max_length=300)
-        return format_html(
-            '<div style="max-width: 600px; white-space: pre-wrap;">{}</div>',
-            preview
-        )
+        preview = obj.answer_preview_cached
+        return mark_safe(_PREVIEW_TPL.format(escape(preview)))
     answer_preview_display.short_description = _('Answer Preview')
     
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search question and answer through the full-text index.
+        
+        On PostgreSQL the GIN-indexed search_vector replaces ILIKE scans over
+        the question/answer columns; other databases use the default
+        search_fields.
+        
+        Args:
+            request: HTTP request object
+            queryset: Queryset to filter
+            search_term: Raw search input
+        
+        Returns:
+            tuple: (filtered queryset, whether duplicates are possible)
+        """
+        if not search_term or not is_full_text_search_available():
+            return super().get_search_results(request, queryset, search_term)
+        
+        return queryset.filter(
+            full_text_search_filter(search_term)
+            | Q(document__title__icontains=search_term)
+            | Q(user__email__icontains=search_term)
+        ), False
+    
     def get_queryset(self, request):
         """
         Optimize queryset by selecting related objects.
         
+        The changelist shows the stored previews, so the full answer (and the
+        related document's content) is not loaded there. The question is kept
+        because __str__ uses it for the action checkbox label.
+        
         Args:
             request: HTTP request object
             
@@ -191,4 +254,15 @@ class AIConversationAdmin(admin.ModelAdmin):
             QuerySet: Optimized queryset
         """
         queryset = super().get_queryset(request)
-        return queryset.select_related('document', 'user', 'document__organization')
+        queryset = queryset.select_related('document', 'user', 'document__organization')
+        if is_changelist(request, self.model):
+            queryset = queryset.only(
+                'question',
+                'created_at',
+                'question_preview_cached',
+                'answer_preview_cached',
+                'document__title',
+                'document__organization__name',
+                'user__email',
+            )
+        return queryset
@@ -14,3 +14,6 @@ class DocumentsConfig(AppConfig):
     name = 'documents'
     verbose_name = 'Documents'
 
+    def ready(self):
+        """Connect signal handlers."""
+        import documents.signals  # noqa: F401
@@ -10,11 +10,150 @@ Key Principle:
 - No manual string concatenation in prompts
 - Clean separation: MCP handles context, LLM service handles API calls
 """
+import functools
 import os
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional
 from django.conf import settings
+from documents.loaders import DocumentContextLoader
 from documents.mcp_server import MCPContextProvider
 
+# Provider SDKs are optional: only the configured provider must be installed
+try:
+    from openai import AsyncOpenAI, OpenAI
+except ImportError:
+    AsyncOpenAI = OpenAI = None
+
+try:
+    from anthropic import Anthropic, AsyncAnthropic
+except ImportError:
+    Anthropic = AsyncAnthropic = None
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
+
+@functools.lru_cache(maxsize=4)
+def _get_openai_client(api_key: str) -> 'OpenAI':
+    """
+    Get a process-wide OpenAI client for the given API key.
+    
+    Clients hold an HTTP connection pool, so they are built once and reused
+    across requests instead of being reconstructed per question.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        OpenAI: Cached OpenAI client
+        
+    Raises:
+        ImportError: If the openai package is not installed
+    """
+    if OpenAI is None:
+        raise ImportError(
+            "OpenAI package not installed. Install it with: pip install openai"
+        )
+    return OpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_anthropic_client(api_key: str) -> 'Anthropic':
+    """
+    Get a process-wide Anthropic client for the given API key.
+    
+    Args:
+        api_key: Anthropic API key
+        
+    Returns:
+        Anthropic: Cached Anthropic client
+        
+    Raises:
+        ImportError: If the anthropic package is not installed
+    """
+    if Anthropic is None:
+        raise ImportError(
+            "Anthropic package not installed. Install it with: pip install anthropic"
+        )
+    return Anthropic(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_async_openai_client(api_key: str) -> 'AsyncOpenAI':
+    """
+    Get a process-wide async OpenAI client for the given API key.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        AsyncOpenAI: Cached async OpenAI client
+        
+    Raises:
+        ImportError: If the openai package is not installed
+    """
+    if AsyncOpenAI is None:
+        raise ImportError(
+            "OpenAI package not installed. Install it with: pip install openai"
+        )
+    return AsyncOpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_async_anthropic_client(api_key: str) -> 'AsyncAnthropic':
+    """
+    Get a process-wide async Anthropic client for the given API key.
+    
+    Args:
+        api_key: Anthropic API key
+        
+    Returns:
+        AsyncAnthropic: Cached async Anthropic client
+        
+    Raises:
+        ImportError: If the anthropic package is not installed
+    """
+    if AsyncAnthropic is None:
+        raise ImportError(
+            "Anthropic package not installed. Install it with: pip install anthropic"
+        )
+    return AsyncAnthropic(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gemini_model(api_key: str, model_name: str):
+    """
+    Get a process-wide Gemini model for the given API key and model name.
+    
+    genai.configure() sets global state, so it is called once per cached
+    (api_key, model_name) pair rather than on every question.
+    
+    Args:
+        api_key: Google API key
+        model_name: Gemini model name
+        
+    Returns:
+        GenerativeModel: Cached Gemini model
+        
+    Raises:
+        ImportError: If the google-generativeai package is not installed
+    """
+    if genai is None:
+        raise ImportError(
+            "Google Generative AI package not installed. "
+            "Install it with: pip install google-generativeai"
+        )
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+# System instruction sent with every OpenAI request
+OPENAI_SYSTEM_PROMPT = (
+    "You are a helpful assistant that answers questions about documents. "
+    "Use the provided document context to answer questions accurately."
+)
+
 
 class LLMService:
     """
@@ -54,7 +193,14 @@ class LLMService:
                 "Please set it in your .env file."
             )
     
-    def ask_question(self, document_id: int, question: str) -> str:
+    def ask_question(
+        self,
+        document_id: int,
+        question: str,
+        loader: Optional[DocumentContextLoader] = None,
+        *,
+        prefetched_context: Optional[str] = None
+    ) -> str:
         """
         Ask a question about a document using LLM with MCP context.
         
@@ -67,6 +213,10 @@ class LLMService:
         Args:
             document_id: ID of the document to query
             question: User's question about the document
+            loader: Optional request-scoped loader; when given, the context is
+                batched and cached with other lookups in the same request
+            prefetched_context: MCP-formatted context already built by the
+                caller; when given, no context lookup happens at all
             
         Returns:
             str: LLM response as a string
@@ -77,20 +227,92 @@ class LLMService:
         """
         # Get document context via MCP (not manual concatenation)
         # This is the key: context comes through MCP protocol
+        if prefetched_context is not None:
+            mcp_context = prefetched_context
+        elif loader is not None:
+            mcp_context = loader.load(document_id)
+        else:
+            mcp_context = self.mcp_provider.provide_document_context(document_id)
+        
+        # Call LLM provider
+        return self._call_llm_provider(self._build_prompt(mcp_context, question))
+    
+    def ask_question_stream(self, document_id: int, question: str) -> Iterator[str]:
+        """
+        Ask a question about a document and yield the answer as it is generated.
+        
+        Synchronous counterpart of ask_question_async for workers, which can
+        persist the answer piece by piece instead of holding all of it.
+        
+        Args:
+            document_id: ID of the document to query
+            question: User's question about the document
+            
+        Yields:
+            str: Chunks of the LLM response, in order
+            
+        Raises:
+            ValueError: If document context cannot be retrieved
+            Exception: If LLM API call fails
+        """
         mcp_context = self.mcp_provider.provide_document_context(document_id)
+        yield from self._stream_llm_provider_sync(self._build_prompt(mcp_context, question))
+    
+    async def ask_question_async(
+        self,
+        document_id: int,
+        question: str,
+        prefetched_context: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Ask a question about a document and stream the answer as it is generated.
+        
+        Uses each provider's native async client with streaming enabled, so
+        the caller receives the first tokens without waiting for the full
+        response and no worker thread is blocked on LLM I/O.
         
-        # Build prompt using MCP-formatted context
-        # The context is already formatted by MCP, we just add the question
-        prompt = f"""{mcp_context}
+        Args:
+            document_id: ID of the document to query
+            question: User's question about the document
+            prefetched_context: MCP-formatted context already fetched by the
+                caller (e.g. after its permission checks)
+            
+        Yields:
+            str: Chunks of the LLM response, in order
+            
+        Raises:
+            ValueError: If document context cannot be retrieved
+            Exception: If LLM API call fails
+        """
+        mcp_context = prefetched_context
+        if mcp_context is None:
+            mcp_context = await self.mcp_provider.aprovide_document_context(document_id)
+        prompt = self._build_prompt(mcp_context, question)
+        
+        async for chunk in self._stream_llm_provider(prompt):
+            yield chunk
+    
+    @staticmethod
+    def _build_prompt(mcp_context: str, question: str) -> str:
+        """
+        Build the LLM prompt from MCP-formatted context and the question.
+        
+        The context is already formatted by MCP, we just add the question.
+        
+        Args:
+            mcp_context: MCP-formatted document context
+            question: User's question about the document
+            
+        Returns:
+            str: Complete prompt for the LLM
+        """
+        return f"""{mcp_context}
 
 User Question: {question}
 
 Please answer the user's question based on the document context provided above.
 Be concise, accurate, and helpful. If the answer cannot be determined from the
 document context, please state that clearly."""
-        
-        # Call LLM provider
-        return self._call_llm_provider(prompt)
     
     def _call_llm_provider(self, prompt: str) -> str:
         """
@@ -137,16 +359,13 @@ document context, please state that clearly."""
             Exception: If API call fails
         """
         try:
-            from openai import OpenAI
-            
-            client = OpenAI(api_key=self.api_key)
+            client = _get_openai_client(self.api_key)
             response = client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a helpful assistant that answers questions about documents. "
-                                   "Use the provided document context to answer questions accurately."
+                        "content": OPENAI_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -158,9 +377,7 @@ document context, please state that clearly."""
             )
             return response.choices[0].message.content.strip()
         except ImportError:
-            raise ImportError(
-                "OpenAI package not installed. Install it with: pip install openai"
-            )
+            raise
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
     
@@ -180,9 +397,7 @@ document context, please state that clearly."""
             Exception: If API call fails
         """
         try:
-            from anthropic import Anthropic
-            
-            client = Anthropic(api_key=self.api_key)
+            client = _get_anthropic_client(self.api_key)
             model = self.model if self.model else "claude-3-5-sonnet-20241022"
             
             response = client.messages.create(
@@ -197,9 +412,7 @@ document context, please state that clearly."""
             )
             return response.content[0].text.strip()
         except ImportError:
-            raise ImportError(
-                "Anthropic package not installed. Install it with: pip install anthropic"
-            )
+            raise
         except Exception as e:
             raise Exception(f"Anthropic API error: {str(e)}")
     
@@ -219,19 +432,275 @@ document context, please state that clearly."""
             Exception: If API call fails
         """
         try:
-            import google.generativeai as genai
-            
-            genai.configure(api_key=self.api_key)
             model_name = self.model if self.model else 'gemini-pro'
-            model = genai.GenerativeModel(model_name)
+            model = _get_gemini_model(self.api_key, model_name)
             
             response = model.generate_content(prompt)
             return response.text.strip()
         except ImportError:
-            raise ImportError(
-                "Google Generative AI package not installed. "
-                "Install it with: pip install google-generativeai"
+            raise
+        except Exception as e:
+            raise Exception(f"Gemini API error: {str(e)}")
+    
+    def _stream_llm_provider_sync(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a response from the configured LLM provider synchronously.
+        
+        Args:
+            prompt: The complete prompt including MCP-formatted context
+            
+        Returns:
+            Iterator[str]: Chunks of the LLM response
+            
+        Raises:
+            ValueError: If provider is not supported
+        """
+        if self.provider == 'openai':
+            return self._stream_openai(prompt)
+        elif self.provider == 'anthropic':
+            return self._stream_anthropic(prompt)
+        elif self.provider == 'gemini':
+            return self._stream_gemini(prompt)
+        else:
+            raise ValueError(
+                f"Unsupported LLM provider: {self.provider}. "
+                "Supported providers: openai, anthropic, gemini"
             )
+    
+    def _stream_openai(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a response from the OpenAI API.
+        
+        Args:
+            prompt: The complete prompt including context
+            
+        Yields:
+            str: Response text chunks
+            
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            client = _get_openai_client(self.api_key)
+            response = client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": OPENAI_SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=0.7,
+                max_tokens=1000,
+                stream=True,
+            )
+            for chunk in response:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ''
+        except ImportError:
+            raise
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+    
+    def _stream_anthropic(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a response from the Anthropic Claude API.
+        
+        Args:
+            prompt: The complete prompt including context
+            
+        Yields:
+            str: Response text chunks
+            
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            client = _get_anthropic_client(self.api_key)
+            model = self.model if self.model else "claude-3-5-sonnet-20241022"
+            
+            with client.messages.stream(
+                model=model,
+                max_tokens=1024,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            ) as stream:
+                yield from stream.text_stream
+        except ImportError:
+            raise
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+    
+    def _stream_gemini(self, prompt: str) -> Iterator[str]:
+        """
+        Stream a response from the Google Gemini API.
+        
+        Args:
+            prompt: The complete prompt including context
+            
+        Yields:
+            str: Response text chunks
+            
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            model_name = self.model if self.model else 'gemini-pro'
+            model = _get_gemini_model(self.api_key, model_name)
+            
+            for chunk in model.generate_content(prompt, stream=True):
+                yield chunk.text
+        except ImportError:
+            raise
+        except Exception as e:
+            raise Exception(f"Gemini API error: {str(e)}")
+    
+    def _stream_llm_provider(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream a response from the configured LLM provider.
+        
+        Args:
+            prompt: The complete prompt including MCP-formatted context
+            
+        Returns:
+            AsyncIterator[str]: Chunks of the LLM response
+            
+        Raises:
+            ValueError: If provider is not supported
+        """
+        if self.provider == 'openai':
+            return self._stream_openai_async(prompt)
+        elif self.provider == 'anthropic':
+            return self._stream_anthropic_async(prompt)
+        elif self.provider == 'gemini':
+            return self._stream_gemini_async(prompt)
+        else:
+            raise ValueError(
+                f"Unsupported LLM provider: {self.provider}. "
+                "Supported providers: openai, anthropic, gemini"
+            )
+    
+    async def _stream_openai_async(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream a response from the OpenAI API.
+        
+        Args:
+            prompt: The complete prompt including context
+            
+        Yields:
+            str: Response text chunks
+            
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            client = _get_async_openai_client(self.api_key)
+            response = await client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": OPENAI_SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=0.7,
+                max_tokens=1000,
+                stream=True,
+            )
+            async for chunk in response:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ''
+        except ImportError:
+            raise
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+    
+    async def _stream_anthropic_async(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream a response from the Anthropic Claude API.
+        
+        Args:
+            prompt: The complete prompt including context
+            
+        Yields:
+            str: Response text chunks
+            
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            client = _get_async_anthropic_client(self.api_key)
+            model = self.model if self.model else "claude-3-5-sonnet-20241022"
+            
+            async with client.messages.stream(
+                model=model,
+                max_tokens=1024,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except ImportError:
+            raise
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+    
+    async def _stream_gemini_async(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream a response from the Google Gemini API.
+        
+        Args:
+            prompt: The complete prompt including context
+            
+        Yields:
+            str: Response text chunks
+            
+        Raises:
+            Exception: If API call fails
+        """
+        try:
+            model_name = self.model if self.model else 'gemini-pro'
+            model = _get_gemini_model(self.api_key, model_name)
+            
+            response = await model.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                yield chunk.text
+        except ImportError:
+            raise
         except Exception as e:
             raise Exception(f"Gemini API error: {str(e)}")
 
+
+@functools.lru_cache(maxsize=1)
+def get_llm_service() -> LLMService:
+    """
+    Get the process-wide LLM service.
+    
+    The service is stateless between questions, so one instance (and its
+    cached provider clients) is shared by every request instead of being
+    built per question. Failures are not cached: while LLM_API_KEY is
+    missing, every call raises ValueError.
+    
+    Returns:
+        LLMService: Shared LLM service
+        
+    Raises:
+        ValueError: If LLM_API_KEY is not configured
+    """
+    return LLMService()
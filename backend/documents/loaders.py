@@ -0,0 +1,159 @@
+"""
+Request-scoped data loaders for documents app.
+
+Loaders batch and cache lookups for the lifetime of a single GraphQL
+request, so resolvers that need the same rows do not each issue their
+own query. Fresh loaders are attached to every request by
+documents.middleware.DocumentContextLoaderMiddleware.
+
+GraphQL execution here is synchronous, so loaders batch what a caller asks
+for in one load_many() call and otherwise deduplicate lookups across
+resolvers of the same request.
+"""
+from typing import Dict, Iterable, List, Optional
+
+from documents.mcp_server import DOCUMENT_CONTEXT_FIELDS, MCPServer
+from documents.models import Document
+
+
+class DocumentLoader:
+    """
+    Batch loader for Document instances by ID.
+
+    Documents are fetched with their organization and creator in one
+    WHERE id IN (...) query and cached on the loader, so every resolver of a
+    request that needs the same document (document, askDocumentAiQuestion,
+    ...) shares a single instance.
+
+    Usage:
+        loader = DocumentLoader()
+        documents = loader.load_many([1, 2, 3])
+        document = loader.load(1)  # served from the loader cache
+    """
+
+    def __init__(self):
+        """Initialize the loader with an empty cache."""
+        self._cache: Dict[int, Optional[Document]] = {}
+
+    def load(self, document_id: int) -> Optional[Document]:
+        """
+        Load a single document.
+
+        Args:
+            document_id: ID of the document
+
+        Returns:
+            Optional[Document]: The document, or None if it does not exist
+        """
+        return self.load_many([document_id])[0]
+
+    def load_many(self, document_ids: Iterable[int]) -> List[Optional[Document]]:
+        """
+        Load several documents in one query.
+
+        Args:
+            document_ids: IDs of the documents
+
+        Returns:
+            list[Optional[Document]]: Documents in the order requested, None
+                for IDs that do not exist
+        """
+        document_ids = list(document_ids)
+        missing = [i for i in dict.fromkeys(document_ids) if i not in self._cache]
+
+        if missing:
+            documents = Document.objects.select_related(
+                'organization',
+                'created_by'
+            ).in_bulk(missing)
+            for document_id in missing:
+                self._cache[document_id] = documents.get(document_id)
+
+        return [self._cache[i] for i in document_ids]
+
+
+class DocumentContextLoader:
+    """
+    Batch loader for MCP-formatted document context.
+
+    All document IDs requested through load_many() are fetched with a single
+    WHERE id IN (...) query, and every formatted context is cached on the
+    loader so repeated requests for the same document are free.
+
+    Usage:
+        loader = DocumentContextLoader()
+        contexts = loader.load_many([1, 2, 3])
+        context = loader.load(1)  # served from the loader cache
+    """
+
+    def __init__(self, mcp_server: MCPServer = None):
+        """
+        Initialize the loader.
+
+        Args:
+            mcp_server: Optional MCPServer instance (creates new one if not provided)
+        """
+        self.mcp_server = mcp_server or MCPServer()
+        self._cache: Dict[int, str] = {}
+
+    def load(self, document_id: int) -> str:
+        """
+        Load the MCP context for a single document.
+
+        Args:
+            document_id: ID of the document
+
+        Returns:
+            str: MCP-formatted context string ready for LLM consumption
+
+        Raises:
+            ValueError: If the document does not exist
+        """
+        return self.load_many([document_id])[0]
+
+    def load_many(self, document_ids: Iterable[int]) -> List[str]:
+        """
+        Load the MCP context for several documents in one query.
+
+        Args:
+            document_ids: IDs of the documents
+
+        Returns:
+            list[str]: MCP-formatted context strings, in the order requested
+
+        Raises:
+            ValueError: If any document does not exist
+        """
+        document_ids = list(document_ids)
+        missing = [i for i in dict.fromkeys(document_ids) if i not in self._cache]
+
+        if missing:
+            rows = {
+                row['id']: row
+                for row in Document.objects.filter(id__in=missing).values(*DOCUMENT_CONTEXT_FIELDS)
+            }
+            for document_id in missing:
+                row = rows.get(document_id)
+                if row is None:
+                    raise ValueError(f'Document {document_id} not found')
+                self._cache[document_id] = self.mcp_server.format_document_values(row)
+
+        return [self._cache[i] for i in document_ids]
+
+    def prime(self, document: Document) -> str:
+        """
+        Cache the MCP context of an already-loaded document on the loader.
+
+        Later load() calls for the document in the same request are then
+        served without a query.
+
+        Args:
+            document: Document instance (with organization and created_by
+                selected)
+
+        Returns:
+            str: MCP-formatted context string ready for LLM consumption
+        """
+        if document.id not in self._cache:
+            self._cache[document.id] = self.mcp_server.format_document(document)
+        return self._cache[document.id]
@@ -12,11 +12,96 @@ Architecture:
 - MCPServer: Core MCP server that exposes document content
 - MCPContextProvider: Bridge between business logic and MCP protocol
 - Separation: MCP logic is separate from GraphQL resolvers and LLM service
+
+Contexts (and their formatted strings) are cached per process, keyed by
+(document_id, updated_at): a warm call costs one primary-key lookup of
+updated_at instead of a JOIN plus dict/string assembly. Saving a document
+changes updated_at, so edits are picked up even by other processes; signal
+handlers (documents/signals.py) additionally drop entries eagerly.
 """
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
 from documents.models import Document
 
 
+# Columns needed to build a context, fetched with one JOIN as plain values
+DOCUMENT_CONTEXT_FIELDS = (
+    'id',
+    'title',
+    'content',
+    'organization_id',
+    'organization__name',
+    'created_at',
+    'updated_at',
+    'created_by__email',
+)
+
+# Upper bound on cached documents per process
+CONTEXT_CACHE_SIZE = 256
+
+_CacheKey = Tuple[int, datetime]
+_CTX_CACHE: 'OrderedDict[_CacheKey, Dict[str, Any]]' = OrderedDict()
+_FORMATTED_CACHE: 'OrderedDict[_CacheKey, str]' = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+
+def _cache_get(cache: OrderedDict, key: _CacheKey):
+    """Return a cached value (marking it recently used), or None."""
+    with _CACHE_LOCK:
+        value = cache.get(key)
+        if value is None:
+            _CACHE_STATS['misses'] += 1
+            return None
+        cache.move_to_end(key)
+        _CACHE_STATS['hits'] += 1
+        return value
+
+
+def _cache_put(cache: OrderedDict, key: _CacheKey, value) -> None:
+    """Store a value, evicting the least recently used entries."""
+    with _CACHE_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > CONTEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def invalidate_document_context(document_id: Optional[int] = None) -> None:
+    """
+    Drop cached contexts for one document, or for all documents.
+    
+    Args:
+        document_id: ID of the document, or None to clear the whole cache
+    """
+    with _CACHE_LOCK:
+        for cache in (_CTX_CACHE, _FORMATTED_CACHE):
+            if document_id is None:
+                cache.clear()
+                continue
+            for key in [key for key in cache if key[0] == document_id]:
+                del cache[key]
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """
+    Get hit/miss counters and sizes of the MCP context caches.
+    
+    Returns:
+        Dict[str, int]: hits, misses, contexts and formatted entry counts
+    """
+    with _CACHE_LOCK:
+        return {
+            'hits': _CACHE_STATS['hits'],
+            'misses': _CACHE_STATS['misses'],
+            'contexts': len(_CTX_CACHE),
+            'formatted': len(_FORMATTED_CACHE),
+        }
+
+
 class MCPServer:
     """
     MCP Server for exposing document content as context.
@@ -37,6 +122,8 @@ class MCPServer:
         
         Retrieves a document from the database and structures it as
         an MCP context dictionary with type, content, and metadata.
+        Contexts are cached per (document_id, updated_at); the returned
+        dictionary is shared and must not be modified.
         
         Args:
             document_id: The ID of the document
@@ -49,25 +136,248 @@ class MCPServer:
                 - content: Document content
                 - metadata: Dictionary with organization_id and created_at
         """
-        try:
-            document = Document.objects.select_related('organization').get(id=document_id)
+        key = MCPServer._get_cache_key(document_id)
+        if key is None:
             return {
-                'type': 'document_context',
-                'document_id': document.id,
-                'title': document.title,
-                'content': document.content,
-                'metadata': {
-                    'organization_id': document.organization_id,
-                    'organization_name': document.organization.name,
-                    'created_at': document.created_at.isoformat(),
-                    'created_by': document.created_by.email if document.created_by else None,
-                }
+                'type': 'error',
+                'message': f'Document {document_id} not found'
             }
-        except Document.DoesNotExist:
+        return MCPServer._get_context_for_key(key)
+    
+    @staticmethod
+    def _get_context_for_key(key: _CacheKey) -> Dict[str, Any]:
+        """
+        Get the context for a cache key, loading the document on a miss.
+        
+        Args:
+            key: (document_id, updated_at) from _get_cache_key
+            
+        Returns:
+            Dict[str, Any]: MCP context dictionary (type 'error' if the
+                document was deleted in the meantime)
+        """
+        context = _cache_get(_CTX_CACHE, key)
+        if context is not None:
+            return context
+        
+        document_id = key[0]
+        row = Document.objects.filter(id=document_id).values(*DOCUMENT_CONTEXT_FIELDS).first()
+        if row is None:
             return {
                 'type': 'error',
                 'message': f'Document {document_id} not found'
             }
+        context = MCPServer.build_document_context_from_values(row)
+        _cache_put(_CTX_CACHE, (document_id, row['updated_at']), context)
+        return context
+    
+    @staticmethod
+    def get_formatted_document_context(document_id: int) -> Optional[str]:
+        """
+        Get document content as an MCP-formatted context string.
+        
+        Equivalent to format_context_for_mcp(get_document_context(...)), but
+        the formatted string is cached alongside the context dictionary.
+        
+        Args:
+            document_id: The ID of the document
+            
+        Returns:
+            Optional[str]: MCP-formatted context string, or None if the
+                document does not exist
+        """
+        key = MCPServer._get_cache_key(document_id)
+        if key is None:
+            return None
+        
+        formatted = _cache_get(_FORMATTED_CACHE, key)
+        if formatted is not None:
+            return formatted
+        
+        context = MCPServer._get_context_for_key(key)
+        if context.get('type') == 'error':
+            return None
+        formatted = MCPServer.format_context_for_mcp(context)
+        _cache_put(_FORMATTED_CACHE, key, formatted)
+        return formatted
+    
+    @staticmethod
+    def format_document(document: Document) -> str:
+        """
+        Get the MCP-formatted context string of an already-loaded document.
+        
+        Skips the database entirely: callers that fetched the document for
+        their own checks pass it here instead of having it queried again.
+        The result is cached like get_formatted_document_context.
+        
+        Args:
+            document: Document instance with organization and created_by
+                selected (select_related), or they are fetched lazily
+            
+        Returns:
+            str: MCP-formatted context string
+        """
+        return MCPServer._format_cached(
+            (document.id, document.updated_at),
+            lambda: MCPServer.build_document_context(document)
+        )
+    
+    @staticmethod
+    def format_document_values(row: Dict[str, Any]) -> str:
+        """
+        Get the MCP-formatted context string of a row fetched with
+        .values(*DOCUMENT_CONTEXT_FIELDS).
+        
+        Like format_document, the result is cached per (id, updated_at), so
+        batch loaders reuse the context (and its formatted timestamps)
+        built by earlier requests.
+        
+        Args:
+            row: Dictionary of document column values
+            
+        Returns:
+            str: MCP-formatted context string
+        """
+        return MCPServer._format_cached(
+            (row['id'], row['updated_at']),
+            lambda: MCPServer.build_document_context_from_values(row)
+        )
+    
+    @staticmethod
+    def _format_cached(key: _CacheKey, build_context) -> str:
+        """
+        Get the formatted context for a cache key, building it on a miss.
+        
+        Args:
+            key: (document_id, updated_at) of the loaded document
+            build_context: Callable returning the context dictionary
+            
+        Returns:
+            str: MCP-formatted context string
+        """
+        formatted = _cache_get(_FORMATTED_CACHE, key)
+        if formatted is not None:
+            return formatted
+        
+        context = _cache_get(_CTX_CACHE, key)
+        if context is None:
+            context = build_context()
+            _cache_put(_CTX_CACHE, key, context)
+        formatted = MCPServer.format_context_for_mcp(context)
+        _cache_put(_FORMATTED_CACHE, key, formatted)
+        return formatted
+    
+    @staticmethod
+    async def aget_formatted_document_context(document_id: int) -> Optional[str]:
+        """
+        Async version of get_formatted_document_context.
+        
+        Uses Django's async ORM, so async views can await the context while
+        other I/O (authentication, permission checks) is in flight. Shares
+        the same process-wide cache as the sync version.
+        
+        Args:
+            document_id: The ID of the document
+            
+        Returns:
+            Optional[str]: MCP-formatted context string, or None if the
+                document does not exist
+        """
+        updated_at = await Document.objects.filter(id=document_id).values_list(
+            'updated_at',
+            flat=True
+        ).afirst()
+        if updated_at is None:
+            return None
+        key = (document_id, updated_at)
+        
+        formatted = _cache_get(_FORMATTED_CACHE, key)
+        if formatted is not None:
+            return formatted
+        
+        context = _cache_get(_CTX_CACHE, key)
+        if context is None:
+            row = await Document.objects.filter(id=document_id).values(
+                *DOCUMENT_CONTEXT_FIELDS
+            ).afirst()
+            if row is None:
+                return None
+            context = MCPServer.build_document_context_from_values(row)
+            key = (document_id, row['updated_at'])
+            _cache_put(_CTX_CACHE, key, context)
+        formatted = MCPServer.format_context_for_mcp(context)
+        _cache_put(_FORMATTED_CACHE, key, formatted)
+        return formatted
+    
+    @staticmethod
+    def _get_cache_key(document_id: int) -> Optional[_CacheKey]:
+        """
+        Build the cache key for a document from its current updated_at.
+        
+        Args:
+            document_id: The ID of the document
+            
+        Returns:
+            Optional[tuple]: (document_id, updated_at), or None if the
+                document does not exist
+        """
+        updated_at = Document.objects.filter(id=document_id).values_list(
+            'updated_at',
+            flat=True
+        ).first()
+        if updated_at is None:
+            return None
+        return (document_id, updated_at)
+    
+    @staticmethod
+    def build_document_context(document: Document) -> Dict[str, Any]:
+        """
+        Structure an already-loaded document as an MCP context dictionary.
+        
+        Args:
+            document: Document instance (ideally with organization selected)
+            
+        Returns:
+            Dict[str, Any]: Dictionary containing MCP-formatted document context
+        """
+        return {
+            'type': 'document_context',
+            'document_id': document.id,
+            'title': document.title,
+            'content': document.content,
+            'metadata': {
+                'organization_id': document.organization_id,
+                'organization_name': document.organization.name,
+                'created_at': document.created_at.isoformat(),
+                'created_by': document.created_by.email if document.created_by else None,
+            }
+        }
+    
+    @staticmethod
+    def build_document_context_from_values(row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Structure a document row fetched with .values(*DOCUMENT_CONTEXT_FIELDS).
+        
+        Avoids model instantiation and related-object descriptors entirely.
+        
+        Args:
+            row: Dictionary of document column values
+            
+        Returns:
+            Dict[str, Any]: Dictionary containing MCP-formatted document context
+        """
+        return {
+            'type': 'document_context',
+            'document_id': row['id'],
+            'title': row['title'],
+            'content': row['content'],
+            'metadata': {
+                'organization_id': row['organization_id'],
+                'organization_name': row['organization__name'],
+                'created_at': row['created_at'].isoformat(),
+                'created_by': row['created_by__email'],
+            }
+        }
     
     @staticmethod
     def format_context_for_mcp(context: Dict[str, Any]) -> str:
@@ -85,19 +395,19 @@ class MCPServer:
             str: MCP-formatted context string ready for LLM consumption
         """
         if context.get('type') == 'document_context':
+            # Single join over the parts: the content can be large, and the
+            # result is cached per document version by get_formatted_document_context
             metadata = context.get('metadata', {})
-            return f"""Document Context (MCP):
-Title: {context['title']}
-Content:
-{context['content']}
-
-Metadata:
-- Document ID: {context['document_id']}
-- Organization ID: {metadata.get('organization_id')}
-- Organization Name: {metadata.get('organization_name', 'N/A')}
-- Created: {metadata.get('created_at')}
-- Created By: {metadata.get('created_by', 'N/A')}
-"""
+            return ''.join((
+                'Document Context (MCP):\nTitle: ', context['title'],
+                '\nContent:\n', context['content'],
+                '\n\nMetadata:\n- Document ID: ', str(context['document_id']),
+                '\n- Organization ID: ', str(metadata.get('organization_id')),
+                '\n- Organization Name: ', str(metadata.get('organization_name', 'N/A')),
+                '\n- Created: ', str(metadata.get('created_at')),
+                '\n- Created By: ', str(metadata.get('created_by', 'N/A')),
+                '\n',
+            ))
         else:
             return context.get('message', 'Unknown context type')
 
@@ -126,7 +436,7 @@ class MCPContextProvider:
         """
         self.mcp_server = mcp_server or MCPServer()
     
-    def provide_document_context(self, document_id: int) -> str:
+    def provide_document_context(self, document_id: int, document: Optional[Document] = None) -> str:
         """
         Provide document context via MCP.
         
@@ -139,6 +449,8 @@ class MCPContextProvider:
         
         Args:
             document_id: ID of the document to provide context for
+            document: The document itself, if the caller already loaded it;
+                it is then formatted without querying the database
             
         Returns:
             str: MCP-formatted context string ready for LLM consumption
@@ -146,10 +458,32 @@ class MCPContextProvider:
         Raises:
             ValueError: If document context cannot be retrieved
         """
-        context = self.mcp_server.get_document_context(document_id)
+        if document is not None:
+            return self.mcp_server.format_document(document)
         
-        if context.get('type') == 'error':
-            raise ValueError(context.get('message', 'Failed to retrieve document context'))
+        formatted = self.mcp_server.get_formatted_document_context(document_id)
         
-        return self.mcp_server.format_context_for_mcp(context)
-
+        if formatted is None:
+            raise ValueError(f'Document {document_id} not found')
+        
+        return formatted
+    
+    async def aprovide_document_context(self, document_id: int) -> str:
+        """
+        Async version of provide_document_context.
+        
+        Args:
+            document_id: ID of the document to provide context for
+            
+        Returns:
+            str: MCP-formatted context string ready for LLM consumption
+            
+        Raises:
+            ValueError: If document context cannot be retrieved
+        """
+        formatted = await self.mcp_server.aget_formatted_document_context(document_id)
+        
+        if formatted is None:
+            raise ValueError(f'Document {document_id} not found')
+        
+        return formatted
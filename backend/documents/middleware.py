@@ -0,0 +1,36 @@
+"""
+GraphQL middleware for documents app.
+
+Graphene middleware runs around every resolver. The middleware here only
+attaches request-scoped helpers to ``info.context`` the first time a
+request reaches a resolver.
+"""
+from documents.loaders import DocumentContextLoader, DocumentLoader
+
+
+class DocumentContextLoaderMiddleware:
+    """
+    Attach fresh document loaders to each GraphQL request.
+
+    The loaders are available to resolvers as ``info.context.document_loader``
+    and ``info.context.document_context_loader`` and live exactly as long as
+    the request, so their caches never serve stale data across requests.
+    """
+
+    def resolve(self, next, root, info, **kwargs):
+        """
+        Ensure the request has its document loaders, then resolve.
+
+        Args:
+            next: Next resolver in the middleware chain
+            root: Root value
+            info: GraphQL resolver info object
+            **kwargs: Field arguments
+
+        Returns:
+            Result of the next resolver
+        """
+        if not hasattr(info.context, 'document_context_loader'):
+            info.context.document_loader = DocumentLoader()
+            info.context.document_context_loader = DocumentContextLoader()
+        return next(root, info, **kwargs)
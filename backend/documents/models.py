@@ -6,6 +6,8 @@ question answering functionality. Documents are organization-scoped,
 enabling multi-tenant document isolation.
 """
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from organizations.models import Organization
@@ -13,6 +15,70 @@ from organizations.models import Organization
 
 User = get_user_model()
 
+# Lengths of the previews stored alongside the full text (shown in admin)
+CONTENT_PREVIEW_LENGTH = 200
+QUESTION_PREVIEW_LENGTH = 150
+ANSWER_PREVIEW_LENGTH = 300
+
+
+def truncate_preview(text: str, max_length: int) -> str:
+    """
+    Truncate text to a preview of at most max_length characters plus '...'.
+    
+    Args:
+        text: Full text
+        max_length: Maximum number of characters to keep
+        
+    Returns:
+        str: Text unchanged if short enough, otherwise truncated with '...'
+    """
+    # One bounded slice decides truncation and provides the kept text
+    snippet = (text or '')[:max_length + 1]
+    if len(snippet) <= max_length:
+        return snippet
+    return f'{snippet[:max_length]}...'
+
+
+def _related_label(instance: models.Model, field_name: str, attribute: str) -> str:
+    """
+    Describe a foreign key without loading it from the database.
+    
+    Uses the related object's attribute when it is already cached on the
+    instance (select_related or earlier access), otherwise the raw id, so
+    __str__/__repr__ never issue a query.
+    
+    Args:
+        instance: Model instance holding the foreign key
+        field_name: Name of the foreign key field
+        attribute: Attribute of the related object to show when cached
+        
+    Returns:
+        str: Related attribute, or '<field_name>=<id>' when not cached
+    """
+    if field_name in instance._state.fields_cache:
+        return str(getattr(instance._state.fields_cache[field_name], attribute))
+    return f'{field_name}={getattr(instance, f"{field_name}_id")}'
+
+
+def _with_preview_fields(update_fields, source_fields: dict):
+    """
+    Extend save(update_fields=...) with the preview columns that depend on it.
+    
+    Args:
+        update_fields: update_fields passed to save(), or None
+        source_fields: Mapping of text field name -> preview field name
+        
+    Returns:
+        Iterable of field names (or None to save all fields)
+    """
+    if update_fields is None:
+        return None
+    update_fields = set(update_fields)
+    for source, preview in source_fields.items():
+        if source in update_fields:
+            update_fields.add(preview)
+    return update_fields
+
 
 class Document(models.Model):
     """
@@ -30,6 +96,8 @@ class Document(models.Model):
         created_by: User who created the document (nullable for data integrity)
         created_at: Timestamp when the document was created
         updated_at: Timestamp when the document was last updated
+        search_vector: Full-text index of title and content (see documents/search.py)
+        content_preview_cached: Truncated content, written on save for admin lists
     """
     
     title = models.CharField(
@@ -65,6 +133,18 @@ class Document(models.Model):
         auto_now=True,
         help_text=_('Timestamp when the document was last updated.'),
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text=_('Full-text search vector of title and content.'),
+    )
+    content_preview_cached = models.CharField(
+        _('content preview'),
+        max_length=CONTENT_PREVIEW_LENGTH + 3,
+        blank=True,
+        editable=False,
+        help_text=_('First characters of the content, updated on save.'),
+    )
     
     class Meta:
         """Meta options for the Document model."""
@@ -73,30 +153,52 @@ class Document(models.Model):
         verbose_name_plural = _('documents')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['organization', 'created_at']),
+            # Serves resolve_documents (organization filter, newest first)
+            # with an index-only scan; content is never included
+            models.Index(
+                fields=['organization', '-created_at'],
+                include=['title', 'created_by', 'updated_at'],
+                name='doc_org_list_covering',
+            ),
             models.Index(fields=['created_by']),
             models.Index(fields=['title']),
+            GinIndex(fields=['search_vector']),
         ]
     
     def __str__(self) -> str:
         """Return a string representation of the document."""
-        return f'{self.title} ({self.organization.name})'
+        return f'{self.title} ({_related_label(self, "organization", "name")})'
     
     def __repr__(self) -> str:
         """Return a developer-friendly representation of the document."""
-        return f'<Document: {self.title}@{self.organization.name}>'
+        return f'<Document: {self.title}@{_related_label(self, "organization", "name")}>'
+    
+    def save(self, *args, **kwargs):
+        """Save the document, refreshing the stored content preview."""
+        self.content_preview_cached = truncate_preview(self.content, CONTENT_PREVIEW_LENGTH)
+        kwargs['update_fields'] = _with_preview_fields(
+            kwargs.get('update_fields'),
+            {'content': 'content_preview_cached'}
+        )
+        super().save(*args, **kwargs)
     
     @property
     def conversation_count(self) -> int:
         """
         Get the number of AI conversations for this document.
         
+        List querysets should annotate ``_conversation_count`` (e.g.
+        ``.annotate(_conversation_count=Count('ai_conversations'))``) so this
+        reads the annotation instead of running one COUNT query per row.
+        
         Returns:
             int: Number of AI conversations
         """
-        return self.ai_conversations.count()
+        count = getattr(self, '_conversation_count', None)
+        if count is None:
+            count = self.ai_conversations.count()
+        return count
     
-    @property
     def content_preview(self, max_length: int = 100) -> str:
         """
         Get a preview of the document content.
@@ -107,9 +209,7 @@ class Document(models.Model):
         Returns:
             str: Content preview truncated to max_length
         """
-        if len(self.content) <= max_length:
-            return self.content
-        return f'{self.content[:max_length]}...'
+        return truncate_preview(self.content, max_length)
 
 
 class AIConversation(models.Model):
@@ -124,10 +224,26 @@ class AIConversation(models.Model):
         document: Foreign key to Document (required)
         user: User who asked the question (required)
         question: User's question (required)
-        answer: AI-generated answer (required)
+        answer: AI-generated answer (empty while the answer is pending)
+        status: Whether the answer is pending, completed, or failed
         created_at: Timestamp when the conversation was created
+        search_vector: Full-text index of question and answer (see documents/search.py)
+        question_preview_cached: Truncated question, written on save for admin lists
+        answer_preview_cached: Truncated answer, written on save for admin lists
     """
     
+    class Status(models.TextChoices):
+        """
+        Status choices for AI conversations.
+        
+        PENDING: Question queued, answer not generated yet
+        COMPLETED: Answer generated successfully
+        FAILED: LLM call failed; answer holds the error message
+        """
+        PENDING = 'PENDING', _('Pending')
+        COMPLETED = 'COMPLETED', _('Completed')
+        FAILED = 'FAILED', _('Failed')
+    
     document = models.ForeignKey(
         Document,
         on_delete=models.CASCADE,
@@ -146,13 +262,40 @@ class AIConversation(models.Model):
     )
     answer = models.TextField(
         _('answer'),
+        blank=True,
         help_text=_('AI-generated answer to the question.'),
     )
+    status = models.CharField(
+        _('status'),
+        max_length=10,
+        choices=Status.choices,
+        default=Status.COMPLETED,
+        help_text=_('Whether the answer is pending, completed, or failed.'),
+    )
     created_at = models.DateTimeField(
         _('created at'),
         auto_now_add=True,
         help_text=_('Timestamp when the conversation was created.'),
     )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text=_('Full-text search vector of question and answer.'),
+    )
+    question_preview_cached = models.CharField(
+        _('question preview'),
+        max_length=QUESTION_PREVIEW_LENGTH + 3,
+        blank=True,
+        editable=False,
+        help_text=_('First characters of the question, updated on save.'),
+    )
+    answer_preview_cached = models.CharField(
+        _('answer preview'),
+        max_length=ANSWER_PREVIEW_LENGTH + 3,
+        blank=True,
+        editable=False,
+        help_text=_('First characters of the answer, updated on save.'),
+    )
     
     class Meta:
         """Meta options for the AIConversation model."""
@@ -161,21 +304,36 @@ class AIConversation(models.Model):
         verbose_name_plural = _('AI conversations')
         ordering = ['-created_at']  # Most recent first
         indexes = [
-            models.Index(fields=['document', 'created_at']),
+            # Serves resolve_ai_conversations (document filter, newest first);
+            # question/answer are too large to include
+            models.Index(
+                fields=['document', '-created_at'],
+                include=['user', 'status'],
+                name='conv_doc_list_covering',
+            ),
             models.Index(fields=['user', 'created_at']),
             models.Index(fields=['created_at']),
+            GinIndex(fields=['search_vector']),
         ]
     
     def __str__(self) -> str:
         """Return a string representation of the conversation."""
-        question_preview = self.question[:50] + '...' if len(self.question) > 50 else self.question
-        return f'Q: {question_preview} ({self.document.title})'
+        return f'Q: {truncate_preview(self.question, 50)} ({_related_label(self, "document", "title")})'
     
     def __repr__(self) -> str:
         """Return a developer-friendly representation of the conversation."""
-        return f'<AIConversation: {self.user.email}@{self.document.id}({self.created_at})>'
+        return f'<AIConversation: {_related_label(self, "user", "email")}@{self.document_id}({self.created_at})>'
+    
+    def save(self, *args, **kwargs):
+        """Save the conversation, refreshing the stored question/answer previews."""
+        self.question_preview_cached = truncate_preview(self.question, QUESTION_PREVIEW_LENGTH)
+        self.answer_preview_cached = truncate_preview(self.answer, ANSWER_PREVIEW_LENGTH)
+        kwargs['update_fields'] = _with_preview_fields(
+            kwargs.get('update_fields'),
+            {'question': 'question_preview_cached', 'answer': 'answer_preview_cached'}
+        )
+        super().save(*args, **kwargs)
     
-    @property
     def question_preview(self, max_length: int = 100) -> str:
         """
         Get a preview of the question.
@@ -186,11 +344,8 @@ class AIConversation(models.Model):
         Returns:
             str: Question preview truncated to max_length
         """
-        if len(self.question) <= max_length:
-            return self.question
-        return f'{self.question[:max_length]}...'
+        return truncate_preview(self.question, max_length)
     
-    @property
     def answer_preview(self, max_length: int = 200) -> str:
         """
         Get a preview of the answer.
@@ -201,6 +356,4 @@ class AIConversation(models.Model):
         Returns:
             str: Answer preview truncated to max_length
         """
-        if len(self.answer) <= max_length:
-            return self.answer
-        return f'{self.answer[:max_length]}...'
+        return truncate_preview(self.answer, max_length)
@@ -5,21 +5,58 @@ This module provides GraphQL queries and mutations for document management
 and AI-powered question answering. All permission checks are enforced at
 the resolver level.
 """
+from typing import Iterator
+
 import graphene
 from graphene_django import DjangoObjectType
 from graphql import GraphQLError
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, F
+from common.gql_optimizer import optimize_queryset
+from common.gql_validation import cost
+from documents.llm_service import get_llm_service
+from documents.loaders import DocumentLoader
+from documents.mcp_server import MCPContextProvider
 from documents.models import Document, AIConversation
-from organizations.permissions import (
-    require_active_organization,
-    require_organization_member,
-    require_document_access,
-    PermissionError
-)
+from documents.tasks import run_llm_question
+from organizations.permissions import get_access_context, PermissionError
+from users.loaders import resolve_user_relation
 
 
 User = get_user_model()
 
+# Rows turned into model instances at a time by list resolvers; lists are
+# streamed into the response instead of materialized up front
+LIST_CHUNK_SIZE = 200
+
+
+def _load_document(info, document_id: int) -> Document:
+    """
+    Load a document through the request's DocumentLoader.
+    
+    Every resolver of a request asking for the same document shares one
+    query and one instance (with organization and created_by selected).
+    
+    Args:
+        info: GraphQL resolver info object
+        document_id: ID of the document
+        
+    Returns:
+        Document: The requested document
+        
+    Raises:
+        GraphQLError: If the document does not exist
+    """
+    loader = getattr(info.context, 'document_loader', None) or DocumentLoader()
+    document = loader.load(document_id)
+    if document is None:
+        raise GraphQLError(
+            f'Document {document_id} not found.',
+            extensions={'code': 'NOT_FOUND'}
+        )
+    return document
+
 
 class DocumentType(DjangoObjectType):
     """
@@ -28,6 +65,14 @@ class DocumentType(DjangoObjectType):
     Exposes document fields to the GraphQL API.
     """
     
+    conversation_count = graphene.Int(
+        required=True,
+        description='Number of AI conversations about this document.'
+    )
+    
+    # Served by the _conversation_count annotation in list resolvers
+    optimizations = {'conversation_count': None}
+    
     class Meta:
         model = Document
         fields = (
@@ -40,6 +85,10 @@ class DocumentType(DjangoObjectType):
             'updated_at'
         )
         description = 'Document type representing a document in an organization.'
+    
+    def resolve_created_by(self, info):
+        """Resolve the creator through the request's user loader."""
+        return resolve_user_relation(self, info, 'created_by')
 
 
 class AIConversationType(DjangoObjectType):
@@ -49,6 +98,8 @@ class AIConversationType(DjangoObjectType):
     Exposes AI conversation fields including question, answer, and metadata.
     """
     
+    status = graphene.String(description='Answer status (PENDING, COMPLETED or FAILED).')
+    
     class Meta:
         model = AIConversation
         fields = (
@@ -57,9 +108,14 @@ class AIConversationType(DjangoObjectType):
             'user',
             'question',
             'answer',
+            'status',
             'created_at'
         )
         description = 'AI conversation type representing a Q&A session about a document.'
+    
+    def resolve_user(self, info):
+        """Resolve the asking user through the request's user loader."""
+        return resolve_user_relation(self, info, 'user')
 
 
 class Query(graphene.ObjectType):
@@ -85,8 +141,14 @@ class Query(graphene.ObjectType):
         required=True,
         description='Get AI conversations for a specific document.'
     )
+    ai_conversation = graphene.Field(
+        AIConversationType,
+        id=graphene.Int(required=True),
+        description='Get a specific AI conversation by ID (e.g. to poll a queued question).'
+    )
     
-    def resolve_documents(self, info) -> list[Document]:
+    @cost(complexity=5)
+    def resolve_documents(self, info) -> Iterator[Document]:
         """
         Resolve documents query.
         
@@ -97,7 +159,7 @@ class Query(graphene.ObjectType):
             info: GraphQL resolver info object
             
         Returns:
-            list[Document]: List of documents in active organization
+            Iterator[Document]: Documents in active organization
             
         Raises:
             GraphQLError: If authentication fails or no active organization
@@ -110,18 +172,9 @@ class Query(graphene.ObjectType):
                 extensions={'code': 'UNAUTHORIZED'}
             )
         
-        # Permission check: Must have active organization
-        try:
-            organization_id = require_active_organization(user)
-        except PermissionError as e:
-            raise GraphQLError(
-                str(e),
-                extensions={'code': 'PERMISSION_DENIED'}
-            )
-        
-        # Permission check: Must be member of organization
+        # Permission check: Must have an active organization it is a member of
         try:
-            require_organization_member(user, organization_id)
+            organization_id = get_access_context(user, info.context).require_active_organization()
         except PermissionError as e:
             raise GraphQLError(
                 str(e),
@@ -131,9 +184,15 @@ class Query(graphene.ObjectType):
         # Return documents in active organization
         documents = Document.objects.filter(
             organization_id=organization_id
-        ).select_related('organization', 'created_by').order_by('-created_at')
-        
-        return list(documents)
+        ).order_by('-created_at')
+        
+        # content is large and rarely listed: never load it unless selected
+        return optimize_queryset(
+            documents,
+            info,
+            defer=('content',),
+            annotations={'conversation_count': Count('ai_conversations')},
+        ).iterator(chunk_size=LIST_CHUNK_SIZE)
     
     def resolve_document(self, info, id: int) -> Document:
         """
@@ -161,20 +220,11 @@ class Query(graphene.ObjectType):
             )
         
         # Get document
-        try:
-            document = Document.objects.select_related(
-                'organization',
-                'created_by'
-            ).get(id=id)
-        except Document.DoesNotExist:
-            raise GraphQLError(
-                f'Document {id} not found.',
-                extensions={'code': 'NOT_FOUND'}
-            )
+        document = _load_document(info, id)
         
         # Permission check: User must be member of document's organization
         try:
-            require_document_access(user, document.organization_id)
+            get_access_context(user, info.context).require_member(document.organization_id)
         except PermissionError as e:
             raise GraphQLError(
                 str(e),
@@ -183,7 +233,8 @@ class Query(graphene.ObjectType):
         
         return document
     
-    def resolve_ai_conversations(self, info, document_id: int) -> list[AIConversation]:
+    @cost(complexity=5)
+    def resolve_ai_conversations(self, info, document_id: int) -> Iterator[AIConversation]:
         """
         Resolve AI conversations query.
         
@@ -196,7 +247,7 @@ class Query(graphene.ObjectType):
             document_id: ID of the document
             
         Returns:
-            list[AIConversation]: List of AI conversations for the document
+            Iterator[AIConversation]: AI conversations for the document
             
         Raises:
             GraphQLError: If authentication fails, document not found, or permission denied
@@ -209,10 +260,13 @@ class Query(graphene.ObjectType):
                 extensions={'code': 'UNAUTHORIZED'}
             )
         
-        # Get document to verify it exists and check permissions
-        try:
-            document = Document.objects.select_related('organization').get(id=document_id)
-        except Document.DoesNotExist:
+        # Only the document's organization is needed to check permissions;
+        # the conversations query below loads whatever the selection asks for
+        organization_id = Document.objects.filter(id=document_id).values_list(
+            'organization_id',
+            flat=True
+        ).first()
+        if organization_id is None:
             raise GraphQLError(
                 f'Document {document_id} not found.',
                 extensions={'code': 'NOT_FOUND'}
@@ -220,7 +274,7 @@ class Query(graphene.ObjectType):
         
         # Permission check: User must be member of document's organization
         try:
-            require_document_access(user, document.organization_id)
+            get_access_context(user, info.context).require_member(organization_id)
         except PermissionError as e:
             raise GraphQLError(
                 str(e),
@@ -230,9 +284,61 @@ class Query(graphene.ObjectType):
         # Return conversations ordered by creation date (newest first)
         conversations = AIConversation.objects.filter(
             document_id=document_id
-        ).select_related('document', 'user').order_by('-created_at')
+        ).order_by('-created_at')
+        
+        return optimize_queryset(conversations, info).iterator(chunk_size=LIST_CHUNK_SIZE)
+    
+    def resolve_ai_conversation(self, info, id: int) -> AIConversation:
+        """
+        Resolve AI conversation query by ID.
         
-        return list(conversations)
+        Used by clients to poll questions queued with queue_document_ai_question
+        until their status is COMPLETED or FAILED. User must be a member of the
+        conversation document's organization.
+        
+        Args:
+            info: GraphQL resolver info object
+            id: AI conversation ID
+            
+        Returns:
+            AIConversation: The requested conversation
+            
+        Raises:
+            GraphQLError: If authentication fails, conversation not found, or permission denied
+        """
+        user = info.context.user
+        
+        if not user or not user.is_authenticated:
+            raise GraphQLError(
+                'Authentication required.',
+                extensions={'code': 'UNAUTHORIZED'}
+            )
+        
+        # Get conversation with just the selected columns; clients poll this,
+        # so the document is only joined for its organization ID, never
+        # loaded with its content
+        conversation = optimize_queryset(
+            AIConversation.objects.filter(id=id).annotate(
+                document_organization_id=F('document__organization_id')
+            ),
+            info
+        ).first()
+        if conversation is None:
+            raise GraphQLError(
+                f'AI conversation {id} not found.',
+                extensions={'code': 'NOT_FOUND'}
+            )
+        
+        # Permission check: User must be member of document's organization
+        try:
+            get_access_context(user, info.context).require_member(conversation.document_organization_id)
+        except PermissionError as e:
+            raise GraphQLError(
+                str(e),
+                extensions={'code': 'PERMISSION_DENIED'}
+            )
+        
+        return conversation
 
 
 class CreateDocument(graphene.Mutation):
@@ -291,18 +397,11 @@ class CreateDocument(graphene.Mutation):
                 extensions={'code': 'UNAUTHORIZED'}
             )
         
-        # Permission check: Must have active organization
+        # Permission check: Must be ADMIN of the active organization
         try:
-            organization_id = require_active_organization(user)
-        except PermissionError as e:
-            raise GraphQLError(
-                str(e),
-                extensions={'code': 'PERMISSION_DENIED'}
-            )
-        
-        # Permission check: Must be ADMIN
-        try:
-            require_organization_admin(user, organization_id)
+            access = get_access_context(user, info.context)
+            organization_id = access.require_active_organization()
+            access.require_admin(organization_id)
         except PermissionError as e:
             raise GraphQLError(
                 str(e),
@@ -310,25 +409,29 @@ class CreateDocument(graphene.Mutation):
             )
         
         # Validate input
-        if not title.strip():
+        title = title.strip()
+        content = content.strip()
+        if not title:
             raise GraphQLError(
                 'Document title cannot be empty.',
                 extensions={'code': 'INVALID_INPUT'}
             )
         
-        if not content.strip():
+        if not content:
             raise GraphQLError(
                 'Document content cannot be empty.',
                 extensions={'code': 'INVALID_INPUT'}
             )
         
-        # Create document
-        document = Document.objects.create(
-            title=title.strip(),
-            content=content.strip(),
-            organization_id=organization_id,
-            created_by=user
-        )
+        # Create document; the INSERT and the search vector refresh done by
+        # post_save commit together
+        with transaction.atomic():
+            document = Document.objects.create(
+                title=title,
+                content=content,
+                organization_id=organization_id,
+                created_by=user
+            )
         
         return cls(document=document)
 
@@ -367,6 +470,7 @@ class AskDocumentAIQuestion(graphene.Mutation):
         )
     
     @classmethod
+    @cost(complexity=500)
     def mutate(cls, root, info, document_id: int, question: str):
         """
         Ask AI question about a document.
@@ -392,17 +496,11 @@ class AskDocumentAIQuestion(graphene.Mutation):
             )
         
         # Get document
-        try:
-            document = Document.objects.select_related('organization').get(id=document_id)
-        except Document.DoesNotExist:
-            raise GraphQLError(
-                f'Document {document_id} not found.',
-                extensions={'code': 'NOT_FOUND'}
-            )
+        document = _load_document(info, document_id)
         
         # Permission check: User must be member of document's organization
         try:
-            require_document_access(user, document.organization_id)
+            get_access_context(user, info.context).require_member(document.organization_id)
         except PermissionError as e:
             raise GraphQLError(
                 str(e),
@@ -410,21 +508,33 @@ class AskDocumentAIQuestion(graphene.Mutation):
             )
         
         # Validate question
-        if not question.strip():
+        question = question.strip()
+        if not question:
             raise GraphQLError(
                 'Question cannot be empty.',
                 extensions={'code': 'INVALID_INPUT'}
             )
         
+        # Build the MCP context from the document loaded above instead of
+        # querying it again; the request loader keeps it for sibling fields
+        loader = getattr(info.context, 'document_context_loader', None)
+        if loader is not None:
+            mcp_context = loader.prime(document)
+        else:
+            mcp_context = MCPContextProvider().provide_document_context(document.id, document=document)
+        
         # Call LLM service (which uses MCP for context)
-        # Note: LLMService will be imported when implemented in next step
+        # Runs outside any transaction so no connection is held during the call
         try:
-            from documents.llm_service import LLMService
-            llm_service = LLMService()
-            answer = llm_service.ask_question(document_id, question.strip())
-        except ImportError:
+            answer = get_llm_service().ask_question(
+                document_id,
+                question,
+                prefetched_context=mcp_context
+            )
+        except ImportError as e:
+            # The configured provider's SDK is not installed
             raise GraphQLError(
-                'LLM service not yet implemented.',
+                str(e),
                 extensions={'code': 'NOT_IMPLEMENTED'}
             )
         except Exception as e:
@@ -433,13 +543,110 @@ class AskDocumentAIQuestion(graphene.Mutation):
                 extensions={'code': 'LLM_ERROR'}
             )
         
-        # Save conversation
-        conversation = AIConversation.objects.create(
-            document=document,
-            user=user,
-            question=question.strip(),
-            answer=answer
+        # Save conversation; the INSERT and the search vector refresh done by
+        # post_save commit together
+        with transaction.atomic():
+            conversation = AIConversation.objects.create(
+                document=document,
+                user=user,
+                question=question,
+                answer=answer
+            )
+        
+        return cls(conversation=conversation)
+
+
+class QueueDocumentAIQuestion(graphene.Mutation):
+    """
+    Mutation to queue an AI question about a document (ADMIN & MEMBER).
+    
+    Unlike AskDocumentAIQuestion, this mutation does not wait for the LLM.
+    It stores the question as a PENDING conversation, hands the LLM call to
+    a background worker, and returns immediately. Clients poll the
+    ai_conversation query until the status is COMPLETED or FAILED.
+    
+    Args:
+        document_id: ID of the document to ask about (required)
+        question: User's question (required)
+        
+    Returns:
+        conversation: The pending AI conversation object
+    """
+    
+    conversation = graphene.Field(
+        AIConversationType,
+        description='The pending AI conversation; poll it for the answer.'
+    )
+    
+    class Arguments:
+        """Input arguments for QueueDocumentAIQuestion mutation."""
+        document_id = graphene.Int(
+            required=True,
+            description='ID of the document to ask about.'
+        )
+        question = graphene.String(
+            required=True,
+            description='User\'s question about the document.'
         )
+    
+    @classmethod
+    @cost(complexity=500)
+    def mutate(cls, root, info, document_id: int, question: str):
+        """
+        Queue an AI question about a document.
+        
+        Args:
+            root: Root value (unused)
+            info: GraphQL resolver info object
+            document_id: ID of the document
+            question: User's question
+            
+        Returns:
+            QueueDocumentAIQuestion: Instance with the pending conversation
+            
+        Raises:
+            GraphQLError: If authentication fails, permission denied, or validation fails
+        """
+        user = info.context.user
+        
+        if not user or not user.is_authenticated:
+            raise GraphQLError(
+                'Authentication required.',
+                extensions={'code': 'UNAUTHORIZED'}
+            )
+        
+        # Get document
+        document = _load_document(info, document_id)
+        
+        # Permission check: User must be member of document's organization
+        try:
+            get_access_context(user, info.context).require_member(document.organization_id)
+        except PermissionError as e:
+            raise GraphQLError(
+                str(e),
+                extensions={'code': 'PERMISSION_DENIED'}
+            )
+        
+        # Validate question
+        question = question.strip()
+        if not question:
+            raise GraphQLError(
+                'Question cannot be empty.',
+                extensions={'code': 'INVALID_INPUT'}
+            )
+        
+        # Save pending conversation; the INSERT and the search vector refresh
+        # done by post_save commit together, and the worker (which fills in
+        # the answer) is dispatched only after that commit so it sees the row
+        with transaction.atomic():
+            conversation = AIConversation.objects.create(
+                document=document,
+                user=user,
+                question=question,
+                answer='',
+                status=AIConversation.Status.PENDING
+            )
+            transaction.on_commit(lambda: run_llm_question.delay(conversation.pk))
         
         return cls(conversation=conversation)
 
@@ -457,4 +664,7 @@ class Mutation(graphene.ObjectType):
     ask_document_ai_question = AskDocumentAIQuestion.Field(
         description='Ask an AI question about a document (ADMIN & MEMBER).'
     )
+    queue_document_ai_question = QueueDocumentAIQuestion.Field(
+        description='Queue an AI question and return immediately (ADMIN & MEMBER).'
+    )
 
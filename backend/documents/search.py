@@ -0,0 +1,68 @@
+"""
+Full-text search for documents app.
+
+Documents and AI conversations carry a ``search_vector`` column (tsvector,
+GIN-indexed) so admin search is an index lookup instead of an
+``ILIKE '%term%'`` scan over large TEXT columns. The vectors are refreshed
+after every save (see documents/signals.py) and after queryset updates
+that touch the searched columns.
+
+Full-text search needs PostgreSQL; on other databases the helpers here are
+no-ops and callers fall back to ``icontains`` search.
+"""
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connection
+from django.db.models import Q, QuerySet
+
+
+# Text search configuration used for both indexing and querying
+SEARCH_CONFIG = 'english'
+
+# Weighted so title/question matches can rank above content/answer matches
+DOCUMENT_SEARCH_VECTOR = (
+    SearchVector('title', weight='A', config=SEARCH_CONFIG)
+    + SearchVector('content', weight='B', config=SEARCH_CONFIG)
+)
+CONVERSATION_SEARCH_VECTOR = (
+    SearchVector('question', weight='A', config=SEARCH_CONFIG)
+    + SearchVector('answer', weight='B', config=SEARCH_CONFIG)
+)
+
+
+def is_full_text_search_available() -> bool:
+    """
+    Check whether the database supports full-text search.
+
+    Returns:
+        bool: True on PostgreSQL
+    """
+    return connection.vendor == 'postgresql'
+
+
+def refresh_search_vectors(queryset: QuerySet, vector: SearchVector) -> None:
+    """
+    Recompute the search_vector column for every row in a queryset.
+
+    Args:
+        queryset: Rows to refresh (Document or AIConversation)
+        vector: Expression to store, e.g. DOCUMENT_SEARCH_VECTOR
+    """
+    if is_full_text_search_available():
+        queryset.update(search_vector=vector)
+
+
+def full_text_search_filter(search_term: str) -> Q:
+    """
+    Build a filter matching rows whose search_vector matches the search term.
+
+    The term is parsed with websearch syntax (quoted phrases, ``or``,
+    ``-exclude``), so arbitrary admin input is safe.
+
+    Args:
+        search_term: Raw search input
+
+    Returns:
+        Q: Filter for a model with a search_vector column
+    """
+    query = SearchQuery(search_term, search_type='websearch', config=SEARCH_CONFIG)
+    return Q(search_vector=query)
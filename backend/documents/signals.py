@@ -0,0 +1,69 @@
+"""
+Signal handlers for documents app.
+
+Document and conversation writes change query results, so they invalidate
+the GraphQL response cache (see common/response_cache.py), and refresh the
+full-text search vector of the saved row (see documents/search.py). They
+also drop cached MCP contexts (see documents/mcp_server.py), including when
+an organization or user shown in a context's metadata changes.
+"""
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from common.response_cache import invalidate_response_cache
+from documents.mcp_server import invalidate_document_context
+from documents.models import AIConversation, Document
+from documents.search import (
+    CONVERSATION_SEARCH_VECTOR,
+    DOCUMENT_SEARCH_VECTOR,
+    refresh_search_vectors,
+)
+from organizations.models import Organization
+
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Document)
+@receiver(post_delete, sender=Document)
+@receiver(post_save, sender=AIConversation)
+@receiver(post_delete, sender=AIConversation)
+def invalidate_cached_responses(sender, instance, **kwargs):
+    """Drop cached GraphQL responses when a document or conversation changes."""
+    # After commit: invalidating earlier would let a concurrent query cache
+    # pre-write data under the new version (runs at once outside atomic())
+    transaction.on_commit(invalidate_response_cache)
+
+
+@receiver(post_save, sender=Document)
+def refresh_document_search_vector(sender, instance, update_fields=None, **kwargs):
+    """Re-index a document's title and content after it is saved."""
+    if update_fields is not None and not {'title', 'content'} & set(update_fields):
+        return
+    refresh_search_vectors(Document.objects.filter(pk=instance.pk), DOCUMENT_SEARCH_VECTOR)
+
+
+@receiver(post_save, sender=AIConversation)
+def refresh_conversation_search_vector(sender, instance, update_fields=None, **kwargs):
+    """Re-index a conversation's question and answer after it is saved."""
+    if update_fields is not None and not {'question', 'answer'} & set(update_fields):
+        return
+    refresh_search_vectors(AIConversation.objects.filter(pk=instance.pk), CONVERSATION_SEARCH_VECTOR)
+
+
+@receiver(post_save, sender=Document)
+@receiver(post_delete, sender=Document)
+def invalidate_cached_document_context(sender, instance, **kwargs):
+    """Drop the cached MCP context of a saved or deleted document."""
+    invalidate_document_context(instance.pk)
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_save, sender=User)
+def invalidate_cached_document_contexts(sender, instance, update_fields=None, **kwargs):
+    """Drop all cached MCP contexts when organization names or user emails may change."""
+    if update_fields is not None and not {'name', 'email'} & set(update_fields):
+        return
+    invalidate_document_context()
@@ -0,0 +1,105 @@
+"""
+Background tasks for documents app.
+
+LLM calls take seconds, so queued questions are answered here by a Celery
+worker instead of inside the GraphQL request. The task fills in the
+pending AIConversation row created by the QueueDocumentAIQuestion mutation.
+
+The answer is streamed from the LLM and appended to the row as it arrives,
+so polling clients see it grow (within the response cache's TTL) and the
+worker never holds all of it.
+"""
+from celery import shared_task
+from django.db.models import TextField, Value
+from django.db.models.functions import Concat
+
+from common.response_cache import invalidate_response_cache
+from documents.llm_service import get_llm_service
+from documents.models import ANSWER_PREVIEW_LENGTH, AIConversation, truncate_preview
+from documents.search import CONVERSATION_SEARCH_VECTOR, refresh_search_vectors
+
+
+# Characters of answer buffered in the worker before appending to the row
+ANSWER_FLUSH_SIZE = 1000
+
+
+@shared_task(ignore_result=True)
+def run_llm_question(conversation_id: int) -> None:
+    """
+    Generate the answer for a pending AI conversation.
+
+    On success the answer is stored and the status set to COMPLETED; on
+    failure the error message is stored and the status set to FAILED, so
+    polling clients always reach a final state. While the answer is being
+    generated the status stays PENDING and the answer holds what has been
+    received so far.
+
+    Args:
+        conversation_id: ID of the pending AIConversation
+    """
+    conversation = AIConversation.objects.filter(
+        pk=conversation_id,
+        status=AIConversation.Status.PENDING
+    ).values('document_id', 'question').first()
+
+    if conversation is None:
+        return
+
+    conversations = AIConversation.objects.filter(pk=conversation_id)
+    # The stored answer is stripped like the non-streaming one: leading
+    # whitespace is dropped and trailing whitespace is held back until more
+    # text follows it. head keeps just enough of it for the preview.
+    head = ''
+    pending = ''
+    try:
+        for chunk in get_llm_service().ask_question_stream(
+            conversation['document_id'],
+            conversation['question']
+        ):
+            pending = (pending + chunk) if head else (pending + chunk).lstrip()
+            if len(pending) >= ANSWER_FLUSH_SIZE:
+                head = _store_answer_part(conversations, pending.rstrip(), head)
+                pending = pending[len(pending.rstrip()):]
+        head = _store_answer_part(conversations, pending.rstrip(), head)
+    except Exception as e:
+        error = f'Error calling LLM: {str(e)}'
+        conversations.update(
+            answer=error,
+            answer_preview_cached=truncate_preview(error, ANSWER_PREVIEW_LENGTH),
+            status=AIConversation.Status.FAILED
+        )
+        invalidate_response_cache()
+        return
+
+    conversations.update(
+        answer_preview_cached=truncate_preview(head, ANSWER_PREVIEW_LENGTH),
+        status=AIConversation.Status.COMPLETED
+    )
+    # update() bypasses save() and post_save, so the answer is indexed and
+    # cached query responses are dropped here
+    refresh_search_vectors(conversations, CONVERSATION_SEARCH_VECTOR)
+    invalidate_response_cache()
+
+
+def _store_answer_part(conversations, text: str, head: str) -> str:
+    """
+    Append text to the stored answer without reading it back.
+
+    Args:
+        conversations: Queryset matching the conversation being answered
+        text: Next part of the answer (nothing is written if empty)
+        head: Beginning of the answer stored so far
+
+    Returns:
+        str: Updated beginning of the answer, long enough for the preview
+    """
+    if not text:
+        return head
+    # The response cache is left alone here: invalidating it bumps the one
+    # global version and would drop every user's cached responses on each
+    # part. Pollers see progress once cached responses expire, and the
+    # final answer as soon as the task completes or fails.
+    conversations.update(
+        answer=Concat('answer', Value(text), output_field=TextField())
+    )
+    return (head + text)[:ANSWER_PREVIEW_LENGTH + 1]
@@ -0,0 +1,146 @@
+"""
+Streaming views for documents app.
+
+GraphQL responses are returned in one piece, so an AI answer is only
+delivered once the LLM has produced all of it. This module provides an
+async view that streams the answer token by token while it is generated
+and stores the finished conversation, mirroring the AskDocumentAIQuestion
+mutation. It must be served under ASGI (config.asgi) to stream.
+
+Errors are returned in the same shape as GraphQL errors, so the client
+can handle both endpoints the same way.
+"""
+import json
+from typing import AsyncIterator
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from graphql_jwt.exceptions import JSONWebTokenError
+from graphql_jwt.shortcuts import get_user_by_token
+from graphql_jwt.utils import get_credentials
+
+from documents.llm_service import get_llm_service
+from documents.mcp_server import MCPContextProvider
+from documents.models import AIConversation, Document
+from organizations.permissions import get_access_context, PermissionError
+
+
+def _error_response(message: str, code: str, status: int) -> JsonResponse:
+    """
+    Build a GraphQL-style error response.
+
+    Args:
+        message: Error message for the client
+        code: Machine-readable error code
+        status: HTTP status code
+
+    Returns:
+        JsonResponse: Response with a single error entry
+    """
+    return JsonResponse(
+        {'errors': [{'message': message, 'extensions': {'code': code}}]},
+        status=status
+    )
+
+
+def _authorize(request: HttpRequest, document_id: int):
+    """
+    Authenticate the JWT user and check access to the document.
+
+    Args:
+        request: HTTP request carrying the JWT Authorization header
+        document_id: ID of the document being asked about
+
+    Returns:
+        tuple: (user, document) on success, or (None, JsonResponse) on failure
+    """
+    token = get_credentials(request)
+    if not token:
+        return None, _error_response('Authentication required.', 'UNAUTHORIZED', 401)
+
+    try:
+        user = get_user_by_token(token, request)
+    except JSONWebTokenError as e:
+        return None, _error_response(str(e), 'UNAUTHORIZED', 401)
+
+    try:
+        document = Document.objects.only('id', 'organization_id').get(id=document_id)
+    except Document.DoesNotExist:
+        return None, _error_response(f'Document {document_id} not found.', 'NOT_FOUND', 404)
+
+    try:
+        get_access_context(user, request).require_member(document.organization_id)
+    except PermissionError as e:
+        return None, _error_response(str(e), 'PERMISSION_DENIED', 403)
+
+    return user, document
+
+
+@csrf_exempt
+@require_POST
+async def ask_document_ai_question_stream(request: HttpRequest) -> HttpResponse:
+    """
+    Stream an AI answer about a document (ADMIN & MEMBER).
+
+    Expects a JSON body ``{"documentId": <int>, "question": <str>}`` and a
+    ``Authorization: JWT <token>`` header. The answer is streamed as
+    ``text/plain`` chunks; once complete it is saved as an AIConversation.
+
+    Args:
+        request: HTTP request object
+
+    Returns:
+        HttpResponse: Streaming answer, or a JSON error response
+    """
+    try:
+        body = json.loads(request.body or b'{}')
+        document_id = int(body['documentId'])
+        question = str(body['question']).strip()
+    except (ValueError, KeyError, TypeError):
+        return _error_response(
+            'Request body must be JSON with documentId and question.',
+            'INVALID_INPUT',
+            400
+        )
+
+    if not question:
+        return _error_response('Question cannot be empty.', 'INVALID_INPUT', 400)
+
+    # Authenticate and check permissions first: the context fetch reads the
+    # whole document and fills the shared context cache, so it only runs
+    # for callers allowed to see the document
+    user, result = await sync_to_async(_authorize)(request, document_id)
+    if user is None:
+        return result
+    document = result
+
+    try:
+        mcp_context = await MCPContextProvider().aprovide_document_context(document_id)
+    except ValueError:
+        # Deleted between the permission check and the context fetch
+        return _error_response(f'Document {document_id} not found.', 'NOT_FOUND', 404)
+
+    try:
+        llm_service = get_llm_service()
+    except ValueError as e:
+        return _error_response(f'Error calling LLM: {str(e)}', 'LLM_ERROR', 500)
+
+    async def stream_answer() -> AsyncIterator[str]:
+        chunks = []
+        async for chunk in llm_service.ask_question_async(
+            document.id,
+            question,
+            prefetched_context=mcp_context
+        ):
+            chunks.append(chunk)
+            yield chunk
+        await AIConversation.objects.acreate(
+            document=document,
+            user=user,
+            question=question,
+            answer=''.join(chunks).strip()
+        )
+
+    return StreamingHttpResponse(stream_answer(), content_type='text/plain; charset=utf-8')
@@ -14,3 +14,6 @@ class OrganizationsConfig(AppConfig):
     name = 'organizations'
     verbose_name = 'Organizations'
 
+    def ready(self):
+        """Connect signal handlers."""
+        import organizations.signals  # noqa: F401
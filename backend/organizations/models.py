@@ -6,8 +6,8 @@ including organization membership with role-based access control (RBAC).
 """
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
-from django.core.exceptions import ValidationError
 
 
 User = get_user_model()
@@ -23,6 +23,8 @@ class Organization(models.Model):
     
     Attributes:
         name: Organization name (required, unique)
+        member_count: Number of memberships (maintained by signals)
+        admin_count: Number of ADMIN memberships (maintained by signals)
         created_at: Timestamp when the organization was created
         updated_at: Timestamp when the organization was last updated
     """
@@ -33,6 +35,18 @@ class Organization(models.Model):
         unique=True,
         help_text=_('Organization name. Must be unique.'),
     )
+    member_count = models.PositiveIntegerField(
+        _('member count'),
+        default=0,
+        editable=False,
+        help_text=_('Number of members. Kept up to date by refresh_membership_counts().'),
+    )
+    admin_count = models.PositiveIntegerField(
+        _('admin count'),
+        default=0,
+        editable=False,
+        help_text=_('Number of administrators. Kept up to date by refresh_membership_counts().'),
+    )
     created_at = models.DateTimeField(
         _('created at'),
         auto_now_add=True,
@@ -62,26 +76,6 @@ class Organization(models.Model):
     def __repr__(self) -> str:
         """Return a developer-friendly representation of the organization."""
         return f'<Organization: {self.name}>'
-    
-    @property
-    def member_count(self) -> int:
-        """
-        Get the number of members in this organization.
-        
-        Returns:
-            int: Number of members
-        """
-        return self.memberships.count()
-    
-    @property
-    def admin_count(self) -> int:
-        """
-        Get the number of administrators in this organization.
-        
-        Returns:
-            int: Number of administrators
-        """
-        return self.memberships.filter(role=OrganizationMembership.Role.ADMIN).count()
 
 
 class OrganizationMembership(models.Model):
@@ -144,14 +138,23 @@ class OrganizationMembership(models.Model):
         verbose_name = _('organization membership')
         verbose_name_plural = _('organization memberships')
         ordering = ['-joined_at']
-        # Ensure a user can only have one membership per organization
-        unique_together = [['user', 'organization']]
+        # (user, organization) is indexed by the unique constraint below
         indexes = [
-            models.Index(fields=['user', 'organization']),
-            models.Index(fields=['role']),
+            # Role is low-cardinality and always filtered together with the
+            # user or the organization, so it is indexed as a suffix of each
+            models.Index(fields=['user', 'role'], name='orgmem_user_role_idx'),
+            models.Index(fields=['organization', 'role'], name='orgmem_org_role_idx'),
+            # Admins are a small share of memberships, so admin checks get
+            # their own much smaller partial index (PostgreSQL and SQLite)
+            models.Index(
+                fields=['organization', 'user'],
+                condition=models.Q(role='ADMIN'),
+                name='orgmem_admin_partial_idx',
+            ),
             models.Index(fields=['joined_at']),
         ]
         constraints = [
+            # Ensure a user can only have one membership per organization
             models.UniqueConstraint(
                 fields=['user', 'organization'],
                 name='unique_user_organization_membership',
@@ -166,27 +169,6 @@ class OrganizationMembership(models.Model):
         """Return a developer-friendly representation of the membership."""
         return f'<OrganizationMembership: {self.user.email}@{self.organization.name}({self.role})>'
     
-    def clean(self) -> None:
-        """
-        Validate the membership instance.
-        
-        Raises:
-            ValidationError: If validation fails
-        """
-        if self.role not in [choice[0] for choice in self.Role.choices]:
-            raise ValidationError(_('Invalid role selected.'))
-    
-    def save(self, *args, **kwargs) -> None:
-        """
-        Save the membership instance after validation.
-        
-        Args:
-            *args: Variable length argument list
-            **kwargs: Arbitrary keyword arguments
-        """
-        self.clean()
-        super().save(*args, **kwargs)
-    
     @property
     def is_admin(self) -> bool:
         """
@@ -206,3 +188,31 @@ class OrganizationMembership(models.Model):
             bool: True if role is MEMBER, False otherwise
         """
         return self.role == self.Role.MEMBER
+
+
+def refresh_membership_counts(organization_id: int) -> None:
+    """
+    Recount an organization's members and admins into its counter columns.
+    
+    Recounting (one UPDATE with two indexed subqueries) rather than applying
+    deltas keeps the counters right after role changes and upserts, where the
+    previous state of the membership is not known.
+    
+    Args:
+        organization_id: ID of the organization to refresh
+    """
+    memberships = OrganizationMembership.objects.filter(
+        organization=models.OuterRef('pk')
+    ).order_by().values('organization')
+    admins = memberships.filter(role=OrganizationMembership.Role.ADMIN)
+    
+    Organization.objects.filter(pk=organization_id).update(
+        member_count=Coalesce(
+            models.Subquery(memberships.annotate(count=models.Count('pk')).values('count')),
+            0
+        ),
+        admin_count=Coalesce(
+            models.Subquery(admins.annotate(count=models.Count('pk')).values('count')),
+            0
+        ),
+    )
@@ -7,8 +7,13 @@ here, not in the frontend, ensuring security at the API layer.
 
 All functions raise PermissionError which should be caught and converted
 to GraphQLError in GraphQL resolvers.
+
+Resolvers should prefer get_access_context(), which loads all of a user's
+memberships in one query and caches them on the request, over chaining the
+individual require_* helpers (one or two queries each).
 """
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, Optional
 from django.contrib.auth import get_user_model
 from organizations.models import OrganizationMembership, Organization
 
@@ -60,19 +65,19 @@ def get_user_active_organization(user: User) -> Organization:
             'No active organization selected. Please select an organization first.'
         )
     
-    try:
-        membership = OrganizationMembership.objects.select_related('organization').get(
-            user=user,
-            organization_id=user.active_organization_id
-        )
-        return membership.organization
-    except OrganizationMembership.DoesNotExist:
+    # The organization itself, joined to the membership only to filter
+    organization = Organization.objects.filter(
+        id=user.active_organization_id,
+        memberships__user_id=user.pk
+    ).first()
+    if organization is None:
         raise PermissionError(
             f'User is not a member of organization {user.active_organization_id}.'
         )
+    return organization
 
 
-def check_user_in_organization(user: User, organization_id: int) -> bool:
+def check_user_in_organization(user: User, organization_id: int, request=None) -> bool:
     """
     Check if a user is a member of a specific organization.
     
@@ -82,38 +87,39 @@ def check_user_in_organization(user: User, organization_id: int) -> bool:
     Args:
         user: User instance
         organization_id: ID of the organization to check
+        request: HTTP request (info.context); when given, the answer comes
+            from the memberships cached on it by get_access_context
         
     Returns:
         bool: True if user is a member, False otherwise
     """
-    return OrganizationMembership.objects.filter(
-        user=user,
-        organization_id=organization_id
-    ).exists()
+    if request is not None:
+        return get_access_context(user, request).is_member(organization_id)
+    return organization_id in user.membership_organization_ids
 
 
-def get_user_role_in_organization(user: User, organization_id: int) -> Optional[str]:
+def get_user_role_in_organization(user: User, organization_id: int, request=None) -> Optional[str]:
     """
     Get the user's role in a specific organization.
     
     Args:
         user: User instance
         organization_id: ID of the organization
+        request: HTTP request (info.context); when given, the answer comes
+            from the memberships cached on it by get_access_context
         
     Returns:
         str: User's role (ADMIN or MEMBER) or None if not a member
     """
-    try:
-        membership = OrganizationMembership.objects.get(
-            user=user,
-            organization_id=organization_id
-        )
-        return membership.role
-    except OrganizationMembership.DoesNotExist:
-        return None
+    if request is not None:
+        return get_access_context(user, request).roles.get(organization_id)
+    return OrganizationMembership.objects.filter(
+        user_id=user.pk,
+        organization_id=organization_id
+    ).values_list('role', flat=True).first()
 
 
-def require_organization_member(user: User, organization_id: int) -> None:
+def require_organization_member(user: User, organization_id: int, request=None) -> None:
     """
     Require that a user is a member of a specific organization.
     
@@ -123,25 +129,22 @@ def require_organization_member(user: User, organization_id: int) -> None:
     Args:
         user: User instance
         organization_id: ID of the organization
+        request: HTTP request (info.context) to share the membership cache of
         
     Raises:
         PermissionError: If user is not a member of the organization
     """
+    if request is not None:
+        get_access_context(user, request).require_member(organization_id)
+        return
     if not check_user_in_organization(user, organization_id):
-        # Try to get organization name for better error message
-        try:
-            org = Organization.objects.get(id=organization_id)
-            org_name = org.name
-        except Organization.DoesNotExist:
-            org_name = f'Organization {organization_id}'
-        
         raise PermissionError(
-            f'User is not a member of organization "{org_name}". '
+            f'User is not a member of organization "{_get_organization_name(organization_id)}". '
             'Access denied.'
         )
 
 
-def require_organization_admin(user: User, organization_id: int) -> None:
+def require_organization_admin(user: User, organization_id: int, request=None) -> None:
     """
     Require that a user is an ADMIN of a specific organization.
     
@@ -151,30 +154,32 @@ def require_organization_admin(user: User, organization_id: int) -> None:
     Args:
         user: User instance
         organization_id: ID of the organization
+        request: HTTP request (info.context) to share the membership cache of
         
     Raises:
         PermissionError: If user is not an admin of the organization
     """
-    role = get_user_role_in_organization(user, organization_id)
+    if request is not None:
+        get_access_context(user, request).require_admin(organization_id)
+        return
     
-    if role != OrganizationMembership.Role.ADMIN:
-        # Try to get organization name for better error message
-        try:
-            org = Organization.objects.get(id=organization_id)
-            org_name = org.name
-        except Organization.DoesNotExist:
-            org_name = f'Organization {organization_id}'
-        
-        if role is None:
-            raise PermissionError(
-                f'User is not a member of organization "{org_name}". '
-                'Only administrators can perform this action.'
-            )
-        else:
-            raise PermissionError(
-                f'User must be an ADMIN in organization "{org_name}" to perform this action. '
-                f'Current role: {role}.'
-            )
+    # Role and organization name in one JOIN; the organization is only
+    # looked up separately when the user is not a member at all
+    membership = OrganizationMembership.objects.filter(
+        user=user,
+        organization_id=organization_id
+    ).values('role', 'organization__name').first()
+    
+    if membership is None:
+        raise PermissionError(
+            f'User is not a member of organization "{_get_organization_name(organization_id)}". '
+            'Only administrators can perform this action.'
+        )
+    if membership['role'] != OrganizationMembership.Role.ADMIN:
+        raise PermissionError(
+            f'User must be an ADMIN in organization "{membership["organization__name"]}" '
+            f'to perform this action. Current role: {membership["role"]}.'
+        )
 
 
 def require_active_organization(user: User) -> int:
@@ -236,3 +241,168 @@ def require_document_access(user: User, document_organization_id: int) -> None:
     """
     require_organization_member(user, document_organization_id)
 
+
+@dataclass(frozen=True)
+class AccessContext:
+    """
+    Organization access of one user, loaded with a single query.
+    
+    Attributes:
+        active_organization_id: ID of the user's active organization, or None
+        roles: Role of the user keyed by organization ID
+        organization_names: Name of each organization the user belongs to
+    """
+    
+    active_organization_id: Optional[int]
+    roles: Dict[int, str]
+    organization_names: Dict[int, str]
+    
+    def is_member(self, organization_id: int) -> bool:
+        """
+        Check if the user is a member of an organization.
+        
+        Args:
+            organization_id: ID of the organization
+            
+        Returns:
+            bool: True if user is a member, False otherwise
+        """
+        return organization_id in self.roles
+    
+    def is_admin(self, organization_id: int) -> bool:
+        """
+        Check if the user is an ADMIN of an organization.
+        
+        Args:
+            organization_id: ID of the organization
+            
+        Returns:
+            bool: True if user is an admin, False otherwise
+        """
+        return self.roles.get(organization_id) == OrganizationMembership.Role.ADMIN
+    
+    def require_active_organization(self) -> int:
+        """
+        Require an active organization the user is still a member of.
+        
+        Returns:
+            int: The active organization ID
+            
+        Raises:
+            PermissionError: If no active organization is selected or the user
+                is not a member of it
+        """
+        if not self.active_organization_id:
+            raise PermissionError(
+                'No active organization selected. Please select an organization to continue.'
+            )
+        self.require_member(self.active_organization_id)
+        return self.active_organization_id
+    
+    def require_member(self, organization_id: int) -> None:
+        """
+        Require that the user is a member of an organization.
+        
+        Args:
+            organization_id: ID of the organization
+            
+        Raises:
+            PermissionError: If user is not a member of the organization
+        """
+        if not self.is_member(organization_id):
+            raise PermissionError(
+                f'User is not a member of organization "{_get_organization_name(organization_id)}". '
+                'Access denied.'
+            )
+    
+    def require_admin(self, organization_id: int) -> None:
+        """
+        Require that the user is an ADMIN of an organization.
+        
+        Args:
+            organization_id: ID of the organization
+            
+        Raises:
+            PermissionError: If user is not an admin of the organization
+        """
+        role = self.roles.get(organization_id)
+        if role is None:
+            raise PermissionError(
+                f'User is not a member of organization "{_get_organization_name(organization_id)}". '
+                'Only administrators can perform this action.'
+            )
+        if role != OrganizationMembership.Role.ADMIN:
+            raise PermissionError(
+                f'User must be an ADMIN in organization "{self.organization_names[organization_id]}" '
+                f'to perform this action. Current role: {role}.'
+            )
+
+
+def get_access_context(user: User, request=None) -> AccessContext:
+    """
+    Get a user's organization access, loading all memberships in one query.
+    
+    When a request is given, the memberships are cached on it so every
+    resolver of the same GraphQL request shares the query. The active
+    organization is always read from the user, so SetActiveOrganization
+    earlier in the same request is honoured.
+    
+    Args:
+        user: Authenticated user instance
+        request: HTTP request (info.context) to cache the memberships on
+        
+    Returns:
+        AccessContext: The user's roles and active organization
+    """
+    cached = getattr(request, '_organization_access', None)
+    if cached is not None and cached[0] == user.pk:
+        roles, organization_names = cached[1], cached[2]
+    else:
+        roles = {}
+        organization_names = {}
+        memberships = OrganizationMembership.objects.filter(user=user).values_list(
+            'organization_id', 'role', 'organization__name'
+        )
+        for organization_id, role, organization_name in memberships:
+            roles[organization_id] = role
+            organization_names[organization_id] = organization_name
+        if request is not None:
+            request._organization_access = (user.pk, roles, organization_names)
+    
+    return AccessContext(
+        active_organization_id=user.active_organization_id,
+        roles=roles,
+        organization_names=organization_names,
+    )
+
+
+def clear_access_context(request) -> None:
+    """
+    Drop the memberships cached on a request by get_access_context.
+    
+    Call after changing memberships in a mutation so later fields of the
+    same request see the change. The organization IDs cached on the
+    request's user are dropped as well.
+    
+    Args:
+        request: HTTP request (info.context)
+    """
+    if hasattr(request, '_organization_access'):
+        del request._organization_access
+    user = getattr(request, 'user', None)
+    if user is not None:
+        user.__dict__.pop('membership_organization_ids', None)
+
+
+def _get_organization_name(organization_id: int) -> str:
+    """
+    Get an organization's name for an error message.
+    
+    Args:
+        organization_id: ID of the organization
+        
+    Returns:
+        str: Organization name, or 'Organization <id>' if it does not exist
+    """
+    name = Organization.objects.filter(id=organization_id).values_list('name', flat=True).first()
+    return name if name is not None else f'Organization {organization_id}'
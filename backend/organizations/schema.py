@@ -9,16 +9,26 @@ import graphene
 from graphene_django import DjangoObjectType
 from graphql import GraphQLError
 from django.contrib.auth import get_user_model
-from organizations.models import Organization, OrganizationMembership
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+from common.gql_optimizer import optimize_queryset
+from common.response_cache import invalidate_response_cache
+from organizations.models import Organization, OrganizationMembership, refresh_membership_counts
 from organizations.permissions import (
     check_user_in_organization,
     require_organization_admin,
+    clear_access_context,
     PermissionError
 )
+from users.loaders import resolve_user_relation
+from users.middleware import invalidate_user_cache
 
 
 User = get_user_model()
 
+# Roles accepted by InviteUserToOrganization
+_VALID_ROLES = frozenset(OrganizationMembership.Role.values)
+
 
 class OrganizationType(DjangoObjectType):
     """
@@ -46,6 +56,10 @@ class OrganizationMembershipType(DjangoObjectType):
         model = OrganizationMembership
         fields = ('id', 'user', 'organization', 'role', 'joined_at')
         description = 'Organization membership type representing user-organization relationship with role.'
+    
+    def resolve_user(self, info):
+        """Resolve the member through the request's user loader."""
+        return resolve_user_relation(self, info, 'user')
 
 
 class Query(graphene.ObjectType):
@@ -85,15 +99,11 @@ class Query(graphene.ObjectType):
                 extensions={'code': 'UNAUTHORIZED'}
             )
         
-        # Get all organizations where user is a member
-        memberships = OrganizationMembership.objects.filter(
-            user=user
-        ).select_related('organization')
-        
-        organization_ids = memberships.values_list('organization_id', flat=True)
-        organizations = Organization.objects.filter(id__in=organization_ids).order_by('name')
+        # Get all organizations where user is a member (one JOIN; no DISTINCT
+        # needed since a user has at most one membership per organization)
+        organizations = Organization.objects.filter(memberships__user=user).order_by('name')
         
-        return list(organizations)
+        return list(optimize_queryset(organizations, info))
 
 
 class SetActiveOrganization(graphene.Mutation):
@@ -154,7 +164,7 @@ class SetActiveOrganization(graphene.Mutation):
         
         # Permission check: User must be a member of the organization
         try:
-            if not check_user_in_organization(user, organization_id):
+            if not check_user_in_organization(user, organization_id, info.context):
                 raise PermissionError(
                     f'User is not a member of organization {organization_id}.'
                 )
@@ -173,9 +183,10 @@ class SetActiveOrganization(graphene.Mutation):
                 extensions={'code': 'NOT_FOUND'}
             )
         
-        # Set active organization
-        user.active_organization_id = organization_id
-        user.save(update_fields=['active_organization_id'])
+        # Set active organization; the instance is kept on the user so
+        # later reads of user.active_organization need no query
+        user.active_organization = organization
+        user.save(update_fields=['active_organization'])
         
         return cls(success=True, organization=organization)
 
@@ -250,50 +261,71 @@ class InviteUserToOrganization(graphene.Mutation):
         
         # Permission check: Must be ADMIN of the organization
         try:
-            require_organization_admin(user, organization_id)
+            require_organization_admin(user, organization_id, info.context)
         except PermissionError as e:
             raise GraphQLError(
                 str(e),
                 extensions={'code': 'PERMISSION_DENIED'}
             )
         
-        # Verify organization exists
-        try:
-            organization = Organization.objects.get(id=organization_id)
-        except Organization.DoesNotExist:
-            raise GraphQLError(
-                f'Organization {organization_id} not found.',
-                extensions={'code': 'NOT_FOUND'}
-            )
-        
-        # Get or create the user to invite
-        try:
-            invite_user = User.objects.get(email=user_email)
-        except User.DoesNotExist:
+        # Look up the user to invite, ignoring case (served by the
+        # lower(email) unique index); only the ID is needed
+        invite_user_id = User.objects.alias(email_lower=Lower('email')).filter(
+            email_lower=user_email.lower()
+        ).values_list('id', flat=True).first()
+        if invite_user_id is None:
             raise GraphQLError(
                 f'User with email {user_email} does not exist.',
                 extensions={'code': 'USER_NOT_FOUND'}
             )
         
         # Validate role
-        valid_roles = [OrganizationMembership.Role.ADMIN, OrganizationMembership.Role.MEMBER]
-        if role not in valid_roles:
+        if role not in _VALID_ROLES:
             raise GraphQLError(
-                f'Invalid role: {role}. Must be one of: {", ".join(valid_roles)}.',
+                f'Invalid role: {role}. Must be one of: {", ".join(OrganizationMembership.Role.values)}.',
                 extensions={'code': 'INVALID_INPUT'}
             )
         
-        # Create or update membership
-        membership, created = OrganizationMembership.objects.get_or_create(
-            user=invite_user,
-            organization=organization,
-            defaults={'role': role}
+        # Create or update membership in one INSERT ... ON CONFLICT DO UPDATE.
+        # The admin check above already proved the organization exists, so
+        # it is referenced by ID; the FK still guards against a concurrent
+        # delete.
+        try:
+            with transaction.atomic():
+                OrganizationMembership.objects.bulk_create(
+                    [OrganizationMembership(
+                        user_id=invite_user_id,
+                        organization_id=organization_id,
+                        role=role
+                    )],
+                    update_conflicts=True,
+                    update_fields=['role'],
+                    unique_fields=['user', 'organization']
+                )
+                # bulk_create() sends no post_save, so the counters are
+                # refreshed here instead of by the membership signals
+                refresh_membership_counts(organization_id)
+        except IntegrityError:
+            raise GraphQLError(
+                f'Organization {organization_id} not found.',
+                extensions={'code': 'NOT_FOUND'}
+            )
+        
+        # Nor does it trigger the signals that drop cached responses and the
+        # invited user's cached membership IDs
+        invalidate_response_cache()
+        invalidate_user_cache(invite_user_id)
+        
+        # Read the row back so an existing membership keeps its joined_at,
+        # with its user and organization for nested selections
+        membership = OrganizationMembership.objects.select_related('user', 'organization').get(
+            user_id=invite_user_id,
+            organization_id=organization_id
         )
         
-        # Update role if membership already existed
-        if not created and membership.role != role:
-            membership.role = role
-            membership.save(update_fields=['role'])
+        # Inviting oneself can change one's own role for later fields
+        if invite_user_id == user.pk:
+            clear_access_context(info.context)
         
         return cls(success=True, membership=membership)
 
@@ -0,0 +1,82 @@
+"""
+Signal handlers for organizations app.
+
+Organization and membership writes change query results and access
+checks, so they invalidate the GraphQL response cache
+(see common/response_cache.py). Membership writes also refresh the
+member/admin counters stored on the organization and invalidate the
+member's cached user (see users/middleware.py), which carries the
+organization IDs used by membership checks; organization writes drop the
+cached choices of the admin organization filter.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from common.response_cache import invalidate_response_cache
+from organizations.admin import invalidate_organization_filter_choices
+from organizations.models import Organization, OrganizationMembership, refresh_membership_counts
+from users.middleware import invalidate_user_cache
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=OrganizationMembership)
+@receiver(post_delete, sender=OrganizationMembership)
+def invalidate_cached_responses(sender, instance, **kwargs):
+    """Drop cached GraphQL responses when an organization or membership changes."""
+    # After commit, as in documents/signals.py: invalidating earlier would
+    # let a concurrent query cache pre-write data under the new version
+    transaction.on_commit(invalidate_response_cache)
+
+
+@receiver(pre_save, sender=OrganizationMembership)
+def remember_previous_organization(sender, instance, update_fields=None, **kwargs):
+    """Note the organization and user a membership is being moved away from, if any."""
+    instance._previous_organization_id = None
+    instance._previous_user_id = None
+    # Only full saves (the admin form) can change the organization or user
+    if instance.pk is None or update_fields is not None:
+        return
+    previous = OrganizationMembership.objects.filter(pk=instance.pk).values_list(
+        'organization_id', 'user_id'
+    ).first()
+    if previous is None:
+        return
+    if previous[0] != instance.organization_id:
+        instance._previous_organization_id = previous[0]
+    if previous[1] != instance.user_id:
+        instance._previous_user_id = previous[1]
+
+
+@receiver(post_save, sender=OrganizationMembership)
+@receiver(post_delete, sender=OrganizationMembership)
+def refresh_organization_counts(sender, instance, **kwargs):
+    """Recount the members and admins of the membership's organization(s)."""
+    refresh_membership_counts(instance.organization_id)
+    previous = getattr(instance, '_previous_organization_id', None)
+    if previous is not None:
+        refresh_membership_counts(previous)
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def invalidate_organization_filter(sender, instance, update_fields=None, **kwargs):
+    """Drop the cached admin filter choices when an organization is added, renamed or deleted."""
+    if update_fields is not None and 'name' not in update_fields:
+        return
+    invalidate_organization_filter_choices()
+
+
+@receiver(post_save, sender=OrganizationMembership)
+@receiver(post_delete, sender=OrganizationMembership)
+def clear_user_membership_cache(sender, instance, **kwargs):
+    """Drop the organization IDs cached for the membership's user(s)."""
+    user = instance._state.fields_cache.get('user')
+    if user is not None:
+        user.__dict__.pop('membership_organization_ids', None)
+    # Cached users outlive the request (see users/middleware.py)
+    invalidate_user_cache(instance.user_id)
+    previous = getattr(instance, '_previous_user_id', None)
+    if previous is not None:
+        invalidate_user_cache(previous)
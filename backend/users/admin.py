@@ -7,6 +7,7 @@ the admin interface for user management.
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
+from common.admin_utils import DeferredJoinPaginator, is_changelist
 from .models import User
 
 
@@ -21,9 +22,16 @@ class UserAdmin(BaseUserAdmin):
     
     # Fields to display in the list view
     list_display = ('email', 'is_active', 'is_staff', 'is_superuser', 'active_organization_id', 'created_at')
-    list_filter = ('is_active', 'is_staff', 'is_superuser', 'created_at')
+    list_filter = ('is_active', 'is_staff', 'is_superuser', 'has_active_organization_db', 'created_at')
     search_fields = ('email',)
-    ordering = ('-created_at',)
+    # Total order matching the users_created_id_desc index
+    ordering = ('-created_at', '-id')
+    # Deep pages skip over index entries instead of full rows
+    paginator = DeferredJoinPaginator
+    # No relations are shown in the list
+    list_select_related = ()
+    # Skip the extra COUNT(*) over the whole table on filtered pages
+    show_full_result_count = False
     
     # Fieldsets for the detail/edit view
     fieldsets = (
@@ -32,7 +40,7 @@ class UserAdmin(BaseUserAdmin):
         (_('Permissions'), {
             'fields': ('is_active', 'is_staff', 'is_superuser', 'groups', 'user_permissions'),
         }),
-        (_('Organization'), {'fields': ('active_organization_id',)}),
+        (_('Organization'), {'fields': ('active_organization',)}),
         (_('Important dates'), {'fields': ('last_login', 'date_joined', 'created_at', 'updated_at')}),
     )
     
@@ -46,5 +54,31 @@ class UserAdmin(BaseUserAdmin):
     
     # Fields that are read-only
     readonly_fields = ('created_at', 'updated_at', 'date_joined', 'last_login')
-
-
+    
+    # Search widget instead of a <select> listing every organization
+    autocomplete_fields = ('active_organization',)
+    
+    def get_queryset(self, request):
+        """
+        Load only the listed columns on the changelist.
+        
+        The password hash, names and dates are only needed by the change
+        form, so the changelist leaves them out.
+        
+        Args:
+            request: HTTP request object
+            
+        Returns:
+            QuerySet: Optimized queryset
+        """
+        queryset = super().get_queryset(request)
+        if is_changelist(request, self.model):
+            queryset = queryset.only(
+                'email',
+                'is_active',
+                'is_staff',
+                'is_superuser',
+                'active_organization',
+                'created_at'
+            )
+        return queryset
@@ -14,3 +14,28 @@ class UsersConfig(AppConfig):
     name = 'users'
     verbose_name = 'Users'
 
+    def ready(self):
+        """Connect signal handlers and warm up the password hashers."""
+        import users.signals  # noqa: F401
+        self.warm_up_password_hashers()
+
+    @staticmethod
+    def warm_up_password_hashers():
+        """
+        Load the configured password hashers and their C libraries.
+
+        Django builds the hashers and imports libraries like bcrypt or
+        argon2 on the first login of each process; doing it at startup keeps
+        that out of request latency. No password is hashed here, so startup
+        does not pay for a key derivation.
+        """
+        from django.contrib.auth.hashers import get_hashers
+
+        for hasher in get_hashers():
+            if getattr(hasher, 'library', None):
+                try:
+                    hasher._load_library()
+                except ValueError:
+                    # Library not installed; Django reports it on first use
+                    pass
+
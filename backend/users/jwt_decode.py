@@ -0,0 +1,74 @@
+"""
+Cached JWT decoding.
+
+django-graphql-jwt verifies the token signature and parses its payload on
+every authenticated request and in the verifyToken/refreshToken mutations.
+cached_jwt_decode is installed as ``GRAPHQL_JWT['JWT_DECODE_HANDLER']`` and
+remembers successfully decoded payloads per process, so a token that is
+used repeatedly is verified once per JWT_DECODE_CACHE_TTL seconds.
+
+Entries never outlive the token's ``exp`` claim, so expired tokens are
+rejected exactly as without the cache. Tokens that fail to decode are not
+cached.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, Tuple
+
+from graphql_jwt.settings import jwt_settings
+from graphql_jwt.utils import jwt_decode
+
+
+# Longest time a decoded payload is reused, in seconds
+JWT_DECODE_CACHE_TTL = 60
+
+# Upper bound on cached payloads per process
+JWT_DECODE_CACHE_SIZE = 4096
+
+# Token digest -> (payload, expiry timestamp)
+_DECODE_CACHE: 'OrderedDict[str, Tuple[Dict[str, Any], float]]' = OrderedDict()
+_DECODE_CACHE_LOCK = threading.Lock()
+
+
+def cached_jwt_decode(token: str, context=None) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT, reusing the payload of a recent decode.
+
+    Args:
+        token: Encoded JWT
+        context: Request object (passed through to jwt_decode)
+
+    Returns:
+        dict: Token payload
+
+    Raises:
+        jwt.InvalidTokenError: If the token is invalid or expired
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    now = time.time()
+    with _DECODE_CACHE_LOCK:
+        entry = _DECODE_CACHE.get(key)
+        if entry is not None:
+            if entry[1] > now:
+                _DECODE_CACHE.move_to_end(key)
+                return dict(entry[0])
+            del _DECODE_CACHE[key]
+
+    payload = jwt_decode(token, context)
+
+    expires_at = now + JWT_DECODE_CACHE_TTL
+    exp = payload.get('exp')
+    if exp is not None and jwt_settings.JWT_VERIFY_EXPIRATION:
+        leeway = jwt_settings.JWT_LEEWAY
+        if isinstance(leeway, timedelta):
+            leeway = leeway.total_seconds()
+        expires_at = min(expires_at, exp + leeway)
+    with _DECODE_CACHE_LOCK:
+        _DECODE_CACHE[key] = (payload, expires_at)
+        _DECODE_CACHE.move_to_end(key)
+        while len(_DECODE_CACHE) > JWT_DECODE_CACHE_SIZE:
+            _DECODE_CACHE.popitem(last=False)
+    return dict(payload)
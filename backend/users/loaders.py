@@ -0,0 +1,172 @@
+"""
+Request-scoped data loaders for users app.
+
+A fresh UserLoader is attached to every GraphQL request by
+users.middleware.UserLoaderMiddleware. Like the document loaders (see
+documents/loaders.py) it batches what a caller asks for in one load_many()
+call and deduplicates lookups across resolvers of the same request.
+
+Users the loader fetches are also kept in Django's cache for
+USER_CACHE_TIMEOUT seconds, so the same users (document authors,
+conversation owners, organization members) are not queried again on every
+request. Entries carry the user's cache version (see users/middleware.py),
+which the signal handlers in users/signals.py bump on every save or delete.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Model
+
+
+User = get_user_model()
+
+# Cache key prefix and lifetime (seconds) of users cached by ID
+USER_CACHE_PREFIX = 'user:'
+USER_CACHE_TIMEOUT = 300
+
+# Columns loaded for related users: the fields UserType exposes. Keeps
+# instances (and their cache entries) small; keep in sync with
+# users.schema.UserType.Meta.fields.
+USER_FIELDS = ('id', 'email', 'username')
+
+
+class UserLoader:
+    """
+    Batch loader for User instances by ID.
+
+    Usage:
+        loader = UserLoader()
+        users = loader.load_many([1, 2, 3])
+        user = loader.load(1)  # served from the loader cache
+    """
+
+    def __init__(self):
+        """Initialize the loader with an empty cache."""
+        self._cache: Dict[int, Optional[User]] = {}
+
+    def prime(self, user: User) -> None:
+        """
+        Add an already loaded user to the cache.
+
+        Args:
+            user: User instance
+        """
+        self._cache.setdefault(user.pk, user)
+
+    def load(self, user_id: int) -> Optional[User]:
+        """
+        Load a single user.
+
+        Args:
+            user_id: ID of the user
+
+        Returns:
+            Optional[User]: The user, or None if it does not exist
+        """
+        return self.load_many([user_id])[0]
+
+    def load_many(self, user_ids: Iterable[int]) -> List[Optional[User]]:
+        """
+        Load several users in one query.
+
+        Args:
+            user_ids: IDs of the users
+
+        Returns:
+            list[Optional[User]]: Users in the order requested, None for IDs
+                that do not exist
+        """
+        user_ids = list(user_ids)
+        missing = [i for i in dict.fromkeys(user_ids) if i not in self._cache]
+
+        if missing:
+            users, versions = self._get_cached(missing)
+            fetch = [i for i in missing if i not in users]
+            if fetch:
+                fetched = User.objects.only(*USER_FIELDS).in_bulk(fetch)
+                self._set_cached(fetched, versions)
+                users.update(fetched)
+            for user_id in missing:
+                self._cache[user_id] = users.get(user_id)
+
+        return [self._cache[i] for i in user_ids]
+
+    @staticmethod
+    def _get_cached(user_ids: List[int]) -> Tuple[Dict[int, User], Dict[int, int]]:
+        """
+        Get users and their cache versions from the shared cache in one round trip.
+
+        Args:
+            user_ids: IDs of the users
+
+        Returns:
+            tuple: (user ID -> user for entries whose version is current,
+                user ID -> current version)
+        """
+        from users.middleware import JWT_USER_VERSION_PREFIX
+
+        keys = [f'{USER_CACHE_PREFIX}{i}' for i in user_ids]
+        version_keys = [f'{JWT_USER_VERSION_PREFIX}{i}' for i in user_ids]
+        found = cache.get_many(keys + version_keys)
+
+        users, versions = {}, {}
+        for user_id, key, version_key in zip(user_ids, keys, version_keys):
+            versions[user_id] = found.get(version_key, 0)
+            entry = found.get(key)
+            if entry is not None and entry[1] == versions[user_id]:
+                users[user_id] = entry[0]
+        return users, versions
+
+    @staticmethod
+    def _set_cached(users: Dict[int, User], versions: Dict[int, int]) -> None:
+        """
+        Store freshly loaded users in the shared cache.
+
+        The versions must have been read before the users were queried, so
+        a save that lands in between leaves a stale-versioned entry rather
+        than stale data under the new version.
+
+        Args:
+            users: User ID -> user, as returned by in_bulk()
+            versions: User ID -> cache version read before the query
+        """
+        if users:
+            cache.set_many(
+                {
+                    f'{USER_CACHE_PREFIX}{user_id}': (user, versions[user_id])
+                    for user_id, user in users.items()
+                },
+                USER_CACHE_TIMEOUT
+            )
+
+
+def resolve_user_relation(instance: Model, info, field_name: str) -> Optional[User]:
+    """
+    Resolve a foreign key to User without a query where possible.
+
+    A relation loaded by select_related is returned as is, the requesting
+    user is reused, and anything else goes through the request's UserLoader.
+
+    Args:
+        instance: Model instance holding the foreign key
+        info: GraphQL resolver info object
+        field_name: Name of the foreign key field (e.g. 'created_by')
+
+    Returns:
+        Optional[User]: The related user, or None if the key is empty
+    """
+    if instance._meta.get_field(field_name).is_cached(instance):
+        return getattr(instance, field_name)
+
+    user_id = getattr(instance, f'{field_name}_id')
+    if user_id is None:
+        return None
+
+    loader = getattr(info.context, 'user_loader', None)
+    if loader is None:
+        return getattr(instance, field_name)
+    request_user = getattr(info.context, 'user', None)
+    if request_user is not None and request_user.pk is not None:
+        loader.prime(request_user)
+    return loader.load(user_id)
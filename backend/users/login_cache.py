@@ -0,0 +1,108 @@
+"""
+Short-lived cache of successful logins.
+
+Password hashing is deliberately slow, and SPAs tend to log in again with the
+same credentials (token refresh flows, health checks). A successful login is
+remembered per process for LOGIN_CACHE_TTL seconds, keyed by an HMAC of the
+credentials (the password itself is never stored), so a repeat login is a
+primary-key lookup instead of an email lookup plus a password hash.
+
+A hit only counts while the user's stored password hash is unchanged, so a
+password change made in any process ends reuse at once; signal handlers
+(users/signals.py) additionally drop entries eagerly.
+"""
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+
+User = get_user_model()
+
+# Seconds a successful login is reused
+LOGIN_CACHE_TTL = 30
+
+# Upper bound on cached logins per process
+LOGIN_CACHE_SIZE = 1024
+
+# Credential digest -> (user ID, password hash at login, expiry timestamp)
+_LOGIN_CACHE: 'OrderedDict[str, Tuple[int, str, float]]' = OrderedDict()
+_LOGIN_CACHE_LOCK = threading.Lock()
+
+
+def _credentials_key(email: str, password: str) -> str:
+    """Return a keyed digest of the credentials."""
+    return hmac.new(
+        settings.SECRET_KEY.encode(),
+        f'{email}:{password}'.encode(),
+        hashlib.sha256
+    ).hexdigest()
+
+
+def get_cached_login(email: str, password: str) -> Optional[User]:
+    """
+    Get the user of a recent successful login with the same credentials.
+
+    Args:
+        email: Email address the user logged in with
+        password: Password the user logged in with
+
+    Returns:
+        User: The authenticated user, or None if there is no usable entry
+            (or the account has been disabled since)
+    """
+    key = _credentials_key(email, password)
+    with _LOGIN_CACHE_LOCK:
+        entry = _LOGIN_CACHE.get(key)
+        if entry is not None and entry[2] <= time.monotonic():
+            del _LOGIN_CACHE[key]
+            entry = None
+    if entry is None:
+        return None
+
+    user_id, password_hash, _expires = entry
+    # Same columns as the uncached login lookup (get_by_natural_key); an
+    # account disabled since is not a hit and fails like any other
+    user = User.objects.only(*User.objects.AUTH_FIELDS).filter(pk=user_id).first()
+    if user is None or user.password != password_hash or not user.is_active:
+        with _LOGIN_CACHE_LOCK:
+            _LOGIN_CACHE.pop(key, None)
+        return None
+    return user
+
+
+def cache_login(email: str, password: str, user: User) -> None:
+    """
+    Remember a successful login.
+
+    Args:
+        email: Email address the user logged in with
+        password: Password the user logged in with
+        user: Authenticated user
+    """
+    key = _credentials_key(email, password)
+    with _LOGIN_CACHE_LOCK:
+        _LOGIN_CACHE[key] = (user.pk, user.password, time.monotonic() + LOGIN_CACHE_TTL)
+        _LOGIN_CACHE.move_to_end(key)
+        while len(_LOGIN_CACHE) > LOGIN_CACHE_SIZE:
+            _LOGIN_CACHE.popitem(last=False)
+
+
+def invalidate_login_cache(user_id: Optional[int] = None) -> None:
+    """
+    Drop cached logins of one user, or of all users.
+
+    Args:
+        user_id: ID of the user, or None to clear the whole cache
+    """
+    with _LOGIN_CACHE_LOCK:
+        if user_id is None:
+            _LOGIN_CACHE.clear()
+            return
+        for key in [k for k, entry in _LOGIN_CACHE.items() if entry[0] == user_id]:
+            del _LOGIN_CACHE[key]
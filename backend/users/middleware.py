@@ -0,0 +1,200 @@
+"""
+GraphQL middleware for users app.
+
+JSONWebTokenMiddleware verifies the JWT and loads the user from the
+database on every GraphQL request. The middleware here remembers the
+authenticated user per token in Django's cache for the token's lifetime,
+so repeat requests with the same token skip that query. It also attaches
+the request-scoped user loader (see users/loaders.py).
+"""
+import time
+from typing import Optional
+
+import jwt
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from graphql_jwt.utils import get_http_authorization, get_token_argument
+
+from users.loaders import UserLoader
+
+
+User = get_user_model()
+
+# Cache key prefixes for token -> user entries and per-user versions
+JWT_USER_CACHE_PREFIX = 'jwt:'
+JWT_USER_VERSION_PREFIX = 'jwt:user-version:'
+
+
+def get_user_cache_version(user_id: int) -> int:
+    """
+    Get the current cache version for a user.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        int: Version number, bumped whenever the user row changes
+    """
+    return cache.get(f'{JWT_USER_VERSION_PREFIX}{user_id}', 0)
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """
+    Invalidate every cached token entry for a user.
+
+    Entries store the user version they were created with; bumping the
+    version makes all of them stale without having to know their keys.
+
+    Args:
+        user_id: ID of the user
+    """
+    key = f'{JWT_USER_VERSION_PREFIX}{user_id}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+class CachedJWTAuthMiddleware:
+    """
+    Serve the JWT-authenticated user from cache.
+
+    Must be listed *after* ``graphql_jwt.middleware.JSONWebTokenMiddleware``
+    in ``GRAPHENE['MIDDLEWARE']``: graphql-core wraps resolvers so that the
+    last middleware runs first. On a cache hit ``info.context.user`` is set
+    before JSONWebTokenMiddleware runs, which then skips authentication
+    because the request is no longer anonymous. On a miss the JWT middleware
+    authenticates as usual and a fresh copy of the user is cached, keyed by
+    the token signature, until the token expires.
+    """
+
+    def resolve(self, next, root, info, **kwargs):
+        """
+        Attach a cached user to the request, then resolve.
+
+        Args:
+            next: Next resolver in the middleware chain
+            root: Root value
+            info: GraphQL resolver info object
+            **kwargs: Field arguments
+
+        Returns:
+            Result of the next resolver
+        """
+        context = info.context
+        if getattr(context, '_jwt_user_cache_checked', False):
+            return next(root, info, **kwargs)
+        context._jwt_user_cache_checked = True
+
+        token = self._get_token(context, **kwargs)
+        if token is None:
+            return next(root, info, **kwargs)
+
+        cache_key = f'{JWT_USER_CACHE_PREFIX}{token.rsplit(".", 1)[-1]}'
+        cached = cache.get(cache_key)
+        if cached is not None:
+            user, version = cached
+            if version == get_user_cache_version(user.pk):
+                context.user = user
+                return next(root, info, **kwargs)
+
+        result = next(root, info, **kwargs)
+
+        user = getattr(context, 'user', None)
+        if user is not None and user.is_authenticated:
+            timeout = self._get_remaining_lifetime(token)
+            if timeout > 0:
+                self._cache_user(cache_key, user.pk, timeout)
+        return result
+
+    @staticmethod
+    def _cache_user(cache_key: str, user_id: int, timeout: int) -> None:
+        """
+        Cache a freshly loaded copy of the authenticated user.
+
+        The request's own user instance is not cached: it was loaded before
+        its version could be read (a save in between would be cached as
+        current), and resolvers may have attached per-request state to it
+        (e.g. membership_organization_ids). The version is read first and
+        the copy loaded after it, like UserLoader does (see users/loaders.py).
+
+        Args:
+            cache_key: Cache key of the token
+            user_id: ID of the authenticated user
+            timeout: Seconds until the token expires
+        """
+        version = get_user_cache_version(user_id)
+        user = User._default_manager.only(*User._default_manager.AUTH_FIELDS).filter(
+            pk=user_id,
+            is_active=True
+        ).first()
+        if user is not None:
+            cache.set(cache_key, (user, version), timeout)
+
+    @staticmethod
+    def _get_token(context, **kwargs) -> Optional[str]:
+        """
+        Get the JWT for an anonymous request, if one was sent.
+
+        Args:
+            context: Request object (info.context)
+            **kwargs: Field arguments
+
+        Returns:
+            str: Token from the Authorization header or cookie, or None
+        """
+        user = getattr(context, 'user', None)
+        if user is not None and user.is_authenticated:
+            return None
+        if get_token_argument(context, **kwargs) is not None:
+            return None
+        return get_http_authorization(context)
+
+    @staticmethod
+    def _get_remaining_lifetime(token: str) -> int:
+        """
+        Get the number of seconds until a verified token expires.
+
+        The token has already been verified by JSONWebTokenMiddleware, so the
+        payload is only read here, not checked again.
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            int: Seconds until expiry (0 if unknown or already expired)
+        """
+        try:
+            payload = jwt.decode(token, options={'verify_signature': False})
+        except jwt.InvalidTokenError:
+            return 0
+        exp = payload.get('exp')
+        if not exp:
+            return 0
+        return int(exp - time.time())
+
+
+class UserLoaderMiddleware:
+    """
+    Attach a fresh UserLoader to each GraphQL request.
+
+    The loader is available to resolvers as ``info.context.user_loader`` and
+    lives exactly as long as the request.
+    """
+
+    def resolve(self, next, root, info, **kwargs):
+        """
+        Ensure the request has its user loader, then resolve.
+
+        Args:
+            next: Next resolver in the middleware chain
+            root: Root value
+            info: GraphQL resolver info object
+            **kwargs: Field arguments
+
+        Returns:
+            Result of the next resolver
+        """
+        if not hasattr(info.context, 'user_loader'):
+            info.context.user_loader = UserLoader()
+        return next(root, info, **kwargs)
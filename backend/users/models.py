@@ -4,8 +4,14 @@ User models.
 This module contains the custom User model that extends Django's AbstractUser
 to use email as the primary authentication identifier instead of username.
 """
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from django.contrib.auth.hashers import check_password, make_password
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.db.models.functions import Lower
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 
@@ -17,6 +23,61 @@ class UserManager(BaseUserManager):
     This manager provides helper methods for creating users and superusers.
     """
     
+    # Columns loaded for users looked up by email to log in or to
+    # authenticate a JWT; the rest are loaded on first access. The
+    # users_email_auth_cover index includes all of them.
+    AUTH_FIELDS = (
+        'id',
+        'email',
+        'username',
+        'password',
+        'is_active',
+        'is_staff',
+        'is_superuser',
+        'active_organization',
+    )
+    
+    @classmethod
+    def normalize_email(cls, email: str | None) -> str:
+        """
+        Normalize an email address by lowercasing its domain part.
+        
+        Same result as Django's implementation, in one pass and without
+        building a new string when the address is already normalized.
+        
+        Args:
+            email: Email address
+            
+        Returns:
+            str: Normalized email address
+        """
+        email = email or ''
+        local, sep, domain = email.strip().rpartition('@')
+        if not sep:
+            return email
+        lowered = domain.lower()
+        if lowered == domain and len(local) + len(domain) + 1 == len(email):
+            return email
+        return f'{local}@{lowered}'
+    
+    def get_by_natural_key(self, email: str) -> 'User':
+        """
+        Get a user by email for authentication.
+        
+        Used by ModelBackend (before check_password) and by the JWT backend,
+        so only the columns those paths and the request need are loaded.
+        
+        Args:
+            email: User's email address
+            
+        Returns:
+            User: The user, with AUTH_FIELDS loaded
+            
+        Raises:
+            User.DoesNotExist: If no user has this email
+        """
+        return self.only(*self.AUTH_FIELDS).get(**{self.model.USERNAME_FIELD: email})
+    
     def create_user(
         self,
         email: str,
@@ -76,6 +137,78 @@ class UserManager(BaseUserManager):
             raise ValueError(_('Superuser must have is_superuser=True.'))
         
         return self.create_user(email, password, **extra_fields)
+    
+    def bulk_create_users(
+        self,
+        rows: Iterable[dict],
+        batch_size: int = 500
+    ) -> list['User']:
+        """
+        Create many regular users with multi-row INSERTs.
+        
+        Meant for seed and import scripts: emails are normalized like in
+        create_user, passwords are hashed on a thread pool (the hashers do
+        their work outside the GIL), and the users are inserted in batches
+        of batch_size instead of one INSERT each. No post_save signals are
+        sent.
+        
+        Args:
+            rows: Dicts with an 'email', an optional 'password' (None sets an
+                unusable password) and any other User fields
+            batch_size: Number of users per INSERT
+            
+        Returns:
+            list[User]: The created users
+            
+        Raises:
+            ValueError: If a row has no email
+        """
+        rows = [dict(row) for row in rows]
+        for row in rows:
+            if not row.get('email'):
+                raise ValueError(_('The Email field must be set'))
+            row['email'] = self.normalize_email(row['email'])
+        
+        with ThreadPoolExecutor() as executor:
+            hashed = list(executor.map(make_password, [row.pop('password', None) for row in rows]))
+        
+        users = [
+            self.model(password=password, **row)
+            for row, password in zip(rows, hashed)
+        ]
+        return self.bulk_create(users, batch_size=batch_size)
+    
+    def batch_check_passwords(self, pairs: Iterable[tuple[str, str]]) -> dict[str, bool]:
+        """
+        Check many email/password pairs at once.
+        
+        Meant for audits and bulk re-authentication: the users are loaded in
+        one query and the passwords are checked on a thread pool, like
+        bulk_create_users hashes them. Outdated hashes are not upgraded.
+        
+        Args:
+            pairs: (email, raw password) tuples
+            
+        Returns:
+            dict[str, bool]: Email -> whether the password is correct; False
+                for unknown emails and inactive users
+        """
+        pairs = list(pairs)
+        users = self.only('email', 'password', 'is_active').in_bulk(
+            {email for email, _password in pairs},
+            field_name=self.model.USERNAME_FIELD
+        )
+        
+        checks = [
+            (email, raw_password, users[email].password)
+            for email, raw_password in pairs
+            if email in users and users[email].is_active
+        ]
+        with ThreadPoolExecutor() as executor:
+            results = executor.map(lambda check: check_password(check[1], check[2]), checks)
+            valid = {email: ok for (email, _raw, _encoded), ok in zip(checks, results)}
+        
+        return {email: valid.get(email, False) for email, _password in pairs}
 
 
 class User(AbstractUser):
@@ -90,7 +223,9 @@ class User(AbstractUser):
     Attributes:
         email: User's email address (unique, used for authentication)
         username: Not used for authentication (kept for compatibility)
-        active_organization_id: ID of the currently selected organization
+        active_organization: Currently selected organization
+        has_active_organization_db: Whether an organization is selected
+            (generated column)
         created_at: Timestamp when the user was created
         updated_at: Timestamp when the user was last updated
     """
@@ -112,10 +247,27 @@ class User(AbstractUser):
     )
     
     # Multi-tenant: Track active organization
-    active_organization_id = models.IntegerField(
+    # Same active_organization_id column as before; as a foreign key it can
+    # be followed with select_related(). No database constraint, so
+    # switching organizations never waits on an organization row lock;
+    # deleting an organization clears the column through the ORM instead.
+    active_organization = models.ForeignKey(
+        'organizations.Organization',
+        on_delete=models.SET_NULL,
         null=True,
         blank=True,
-        help_text=_('ID of the currently active organization for this user.'),
+        db_constraint=False,
+        # Indexed by users_active_org_partial below
+        db_index=False,
+        related_name='+',
+        help_text=_('Currently active organization for this user.'),
+    )
+    
+    # Computed by the database so admin filtering happens in SQL
+    has_active_organization_db = models.GeneratedField(
+        expression=models.Q(active_organization__isnull=False),
+        output_field=models.BooleanField(_('has active organization')),
+        db_persist=True,
     )
     
     # Timestamps
@@ -136,8 +288,32 @@ class User(AbstractUser):
         verbose_name_plural = _('users')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['email']),
-            models.Index(fields=['active_organization_id']),
+            # email is already indexed by its unique constraint; this one
+            # also carries every other column get_by_natural_key() loads
+            # (UserManager.AUTH_FIELDS), so the login lookup can be an
+            # index-only scan on PostgreSQL
+            models.Index(
+                fields=['email'],
+                include=[field for field in UserManager.AUTH_FIELDS if field != 'email'],
+                name='users_email_auth_cover',
+            ),
+            # Admin changelist order (see UserAdmin.ordering); lets deep
+            # pages be found from the index alone
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='users_created_id_desc',
+            ),
+            # Lookups are always by a concrete ID, so NULLs are left out
+            models.Index(
+                fields=['active_organization'],
+                condition=models.Q(active_organization__isnull=False),
+                name='users_active_org_partial',
+            ),
+        ]
+        constraints = [
+            # One account per address regardless of case; the underlying
+            # lower(email) index also serves case-insensitive lookups
+            models.UniqueConstraint(Lower('email'), name='users_email_lower_uniq'),
         ]
     
     def __str__(self) -> str:
@@ -157,3 +333,20 @@ class User(AbstractUser):
             bool: True if active_organization_id is set, False otherwise
         """
         return self.active_organization_id is not None
+    
+    @cached_property
+    def membership_organization_ids(self) -> frozenset:
+        """
+        Get the IDs of the organizations this user belongs to.
+        
+        Loaded with one query and cached on the instance. Instances served
+        from the JWT user cache (see users/middleware.py) are unpickled
+        per request without it, and membership signals bump the user's
+        cache version, so a changed membership is seen by the next request.
+        
+        Returns:
+            frozenset: Organization IDs
+        """
+        return frozenset(
+            self.organization_memberships.values_list('organization_id', flat=True)
+        )
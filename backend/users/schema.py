@@ -7,10 +7,11 @@ including login, token verification, and token refresh functionality.
 import graphene
 from graphene_django import DjangoObjectType
 from graphql import GraphQLError
-from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth import get_user_model
 import graphql_jwt
 from graphql_jwt.decorators import login_required
-from graphql_jwt.utils import jwt_encode, jwt_payload
+from graphql_jwt.shortcuts import get_token
+from users.login_cache import cache_login, get_cached_login
 
 
 User = get_user_model()
@@ -22,6 +23,15 @@ class UserType(DjangoObjectType):
     
     Exposes user fields to the GraphQL API. Only includes safe fields
     that can be exposed publicly (id, email, username).
+    
+    Users are reached through foreign keys (created_by, user), which the
+    parent list resolvers JOIN via optimize_queryset (see
+    common/gql_optimizer.py). Do not override get_queryset here: graphene-django
+    then resolves every FK to this type with its own get_node() query, one
+    per row.
+    
+    Related users are loaded with only these fields (see
+    users.loaders.USER_FIELDS); add new fields there as well.
     """
     
     class Meta:
@@ -39,6 +49,11 @@ class TokenAuth(graphene.Mutation):
     requests. The token should be included in the Authorization header
     as "JWT <token>".
     
+    Clients should pass the credentials as variables rather than inline
+    literals: the parsed and validated document is cached per query text
+    (see config/views.py), so every login then shares one cache entry and
+    no password ends up in the document cache.
+    
     Args:
         email: User's email address (required)
         password: User's password (required)
@@ -67,6 +82,46 @@ class TokenAuth(graphene.Mutation):
             description='User password for authentication.'
         )
     
+    @staticmethod
+    def authenticate(email: str, password: str):
+        """
+        Check email and password the way ModelBackend does, cheapest test first.
+        
+        ModelBackend hashes the password before looking at is_active, so
+        every attempt on a disabled account pays for a full hash. Here the
+        account is loaded first and only active users get their password
+        checked. Unknown emails still hash the password once, as in
+        ModelBackend, so they take as long as a wrong password and do not
+        reveal which emails are registered.
+        
+        Trade-off: a disabled account is rejected without hashing, so
+        response time tells it apart from unknown emails and active
+        accounts. It fails with the same error as a wrong password, so
+        whether the password was right is never revealed.
+        
+        Args:
+            email: User's email address
+            password: User's password
+            
+        Returns:
+            User: The authenticated user, or None if the credentials are
+                invalid or the account is disabled
+        """
+        try:
+            user = User._default_manager.get_by_natural_key(email)
+        except User.DoesNotExist:
+            # Hash anyway so unknown emails take as long as wrong passwords
+            User().set_password(password)
+            return None
+        
+        if not user.is_active:
+            return None
+        
+        # check_password() also upgrades hashes made with an older hasher
+        if not user.check_password(password):
+            return None
+        return user
+    
     @classmethod
     def mutate(cls, root, info, email: str, password: str):
         """
@@ -84,12 +139,13 @@ class TokenAuth(graphene.Mutation):
         Raises:
             GraphQLError: If authentication fails
         """
-        # Authenticate user using email as username
-        user = authenticate(
-            request=info.context,
-            username=email,
-            password=password
-        )
+        # Authenticate user using email as username, reusing a recent
+        # successful login with the same credentials (see users/login_cache.py)
+        user = get_cached_login(email, password)
+        if user is None:
+            user = cls.authenticate(email, password)
+            if user is not None:
+                cache_login(email, password, user)
         
         if user is None:
             raise GraphQLError(
@@ -97,94 +153,12 @@ class TokenAuth(graphene.Mutation):
                 extensions={'code': 'AUTHENTICATION_FAILED'}
             )
         
-        if not user.is_active:
-            raise GraphQLError(
-                'User account is disabled.',
-                extensions={'code': 'ACCOUNT_DISABLED'}
-            )
-        
-        # Generate JWT token
-        payload = jwt_payload(user, info.context)
-        token = jwt_encode(payload)
+        # Generate JWT token with the configured payload/encode handlers
+        token = get_token(user, info.context)
         
         return cls(token=token, user=user)
 
 
-class VerifyToken(graphene.Mutation):
-    """
-    Verify a JWT token and return the payload.
-    
-    This mutation can be used to verify if a token is still valid
-    and get information about the authenticated user.
-    """
-    
-    payload = graphene.JSONString(
-        description='JWT token payload.'
-    )
-    
-    class Arguments:
-        """Input arguments for VerifyToken mutation."""
-        token = graphene.String(
-            required=True,
-            description='JWT token to verify.'
-        )
-    
-    @classmethod
-    def mutate(cls, root, info, token: str):
-        """
-        Verify JWT token.
-        
-        Args:
-            root: Root value (unused)
-            info: GraphQL resolver info object
-            token: JWT token to verify
-            
-        Returns:
-            VerifyToken: Instance with token payload
-        """
-        # Use graphql_jwt's verify mutation
-        return graphql_jwt.Verify.Field().mutate(root, info, token)
-
-
-class RefreshToken(graphene.Mutation):
-    """
-    Refresh a JWT token to get a new token with extended expiration.
-    
-    This mutation generates a new JWT token from an existing valid token,
-    useful for extending user sessions without requiring re-authentication.
-    """
-    
-    token = graphene.String(
-        description='New JWT token with extended expiration.'
-    )
-    payload = graphene.JSONString(
-        description='JWT token payload.'
-    )
-    
-    class Arguments:
-        """Input arguments for RefreshToken mutation."""
-        token = graphene.String(
-            required=True,
-            description='Current JWT token to refresh.'
-        )
-    
-    @classmethod
-    def mutate(cls, root, info, token: str):
-        """
-        Refresh JWT token.
-        
-        Args:
-            root: Root value (unused)
-            info: GraphQL resolver info object
-            token: Current JWT token
-            
-        Returns:
-            RefreshToken: Instance with new token and payload
-        """
-        # Use graphql_jwt's refresh mutation
-        return graphql_jwt.Refresh.Field().mutate(root, info, token)
-
-
 class Mutation(graphene.ObjectType):
     """
     Root mutation type for user authentication.
@@ -196,6 +170,9 @@ class Mutation(graphene.ObjectType):
     token_auth = TokenAuth.Field(
         description='Obtain JWT token using email and password.'
     )
+    # The payload of these two is a GenericScalar, written out by the
+    # view's single json.dumps of the whole response; there is no
+    # per-field JSON encoding to speed up
     verify_token = graphql_jwt.Verify.Field(
         description='Verify JWT token validity.'
     )
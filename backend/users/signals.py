@@ -0,0 +1,36 @@
+"""
+Signal handlers for users app.
+
+Keep the JWT user cache (see users/middleware.py), the user-by-ID cache
+(see users/loaders.py, which shares the JWT cache's per-user version), the
+login cache (see users/login_cache.py) and the GraphQL response cache (see
+common/response_cache.py) consistent with the database: any change to a
+user row (e.g. a new active organization or password) invalidates them.
+"""
+from django.contrib.auth.signals import user_logged_out
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from common.response_cache import invalidate_response_cache
+from users.login_cache import invalidate_login_cache
+from users.middleware import invalidate_user_cache
+from users.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_caches(sender, instance, **kwargs):
+    """Drop cached users and responses when a user is saved or deleted."""
+    invalidate_user_cache(instance.pk)
+    invalidate_login_cache(instance.pk)
+    # After commit, as in documents/signals.py: invalidating earlier would
+    # let a concurrent query cache pre-write data under the new version
+    transaction.on_commit(invalidate_response_cache)
+
+
+@receiver(user_logged_out)
+def invalidate_logins(sender, request, user, **kwargs):
+    """Stop reusing a user's cached logins once the user logs out."""
+    if user is not None:
+        invalidate_login_cache(user.pk)